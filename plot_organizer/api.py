@@ -32,12 +32,20 @@ Example:
 from __future__ import annotations
 
 import json
-import uuid
+import os
+import pickle
+import sys
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def create_datasource(name: str, path: str, schema: list[dict] | None = None) -> dict[str, Any]:
     """Create a datasource descriptor.
@@ -52,13 +60,39 @@ def create_datasource(name: str, path: str, schema: list[dict] | None = None) ->
         Datasource dict with id, name, path, schema
     """
     return {
-        "id": str(uuid.uuid4()),
+        "id": os.urandom(16).hex(),
         "name": name,
         "path": str(path),
         "schema": schema or [],
     }
 
 
+# Default plot descriptor, copied per create_plot call. Copying a pre-built
+# dict is cheaper than re-evaluating a 17-key dict literal per plot, and the
+# copy arrives pre-sized. Only immutable defaults live here; the list
+# fields (hlines/vlines/error_markers) are placeholders that create_plot
+# replaces with a fresh list per call — a shared [] in the template would
+# alias every default descriptor to one mutable object.
+_PLOT_TEMPLATE: dict[str, Any] = {
+    "id": "",
+    "grid_position": None,
+    "datasource_id": "",
+    "x": "",
+    "y": "",
+    "hue": None,
+    "sem_column": None,
+    "sem_precomputed": False,
+    "filter_query": None,
+    "hlines": None,
+    "vlines": None,
+    "style_line": True,
+    "style_marker": False,
+    "ylim": None,
+    "title": None,
+    "error_markers": None,
+}
+
+
 def create_plot(
     datasource_id: str,
     x: str,
@@ -72,13 +106,14 @@ def create_plot(
     sem_column: str | None = None,
     sem_precomputed: bool = False,
     filter_query: dict[str, Any] | None = None,
-    hlines: list[float] | None = None,
-    vlines: list[float] | None = None,
+    hlines: list[float] | np.ndarray | None = None,
+    vlines: list[float] | np.ndarray | None = None,
     style_line: bool = True,
     style_marker: bool = False,
-    ylim: tuple[float, float] | list[float] | None = None,
+    ylim: tuple[float, float] | list[float] | np.ndarray | None = None,
     title: str | None = None,
     error_markers: list[dict[str, Any]] | None = None,
+    _id: str | None = None,
 ) -> dict[str, Any]:
     """Create a plot descriptor.
     
@@ -127,29 +162,67 @@ def create_plot(
         ...     ]
         ... )
     """
-    plot_data = {
-        "id": str(uuid.uuid4()),
-        "grid_position": {
-            "row": row,
-            "col": col,
-            "rowspan": rowspan,
-            "colspan": colspan,
-        },
-        "datasource_id": datasource_id,
-        "x": x,
-        "y": y,
-        "hue": hue,
-        "sem_column": sem_column,
-        "sem_precomputed": sem_precomputed,
-        "filter_query": filter_query,
-        "hlines": hlines or [],
-        "vlines": vlines or [],
-        "style_line": style_line,
-        "style_marker": style_marker,
-        "ylim": list(ylim) if ylim else None,
-        "title": title,
-        "error_markers": error_markers or [],
+    # Callers computing thresholds with numpy can pass arrays directly;
+    # normalize them to plain lists here so descriptors stay JSON-native
+    # for every writer (stdlib json, pickle, equality in tests). tolist()
+    # is one C pass and also converts np.float64 items to Python floats.
+    if isinstance(hlines, np.ndarray):
+        hlines = hlines.tolist()
+    if isinstance(vlines, np.ndarray):
+        vlines = vlines.tolist()
+    if isinstance(ylim, np.ndarray):
+        ylim = ylim.tolist()
+
+    # Intern repeated strings: grouped projects repeat the same column names,
+    # titles and marker styles in every plot dict, and interning collapses
+    # them to one object in memory (and one memo entry in the pickle format).
+    x = sys.intern(x)
+    y = sys.intern(y)
+    if isinstance(hue, str):
+        hue = sys.intern(hue)
+    elif isinstance(hue, list):
+        hue = [sys.intern(h) for h in hue]
+    if isinstance(title, str) and title:
+        title = sys.intern(title)
+    if error_markers:
+        for marker in error_markers:
+            for field in ("color", "marker", "label"):
+                value = marker.get(field)
+                if isinstance(value, str):
+                    marker[field] = sys.intern(value)
+
+    plot_data = _PLOT_TEMPLATE.copy()
+    plot_data["id"] = _id if _id is not None else os.urandom(16).hex()
+    plot_data["grid_position"] = {
+        "row": row,
+        "col": col,
+        "rowspan": rowspan,
+        "colspan": colspan,
     }
+    plot_data["datasource_id"] = datasource_id
+    plot_data["x"] = x
+    plot_data["y"] = y
+    if hue is not None:
+        plot_data["hue"] = hue
+    if sem_column is not None:
+        plot_data["sem_column"] = sem_column
+    if sem_precomputed:
+        plot_data["sem_precomputed"] = True
+    if filter_query is not None:
+        plot_data["filter_query"] = filter_query
+    # Fresh list per descriptor when the caller passed nothing: returned
+    # plots are caller-mutable, so they must not share one default object
+    plot_data["hlines"] = hlines or []
+    plot_data["vlines"] = vlines or []
+    if not style_line:
+        plot_data["style_line"] = False
+    if style_marker:
+        plot_data["style_marker"] = True
+    if ylim:
+        plot_data["ylim"] = ylim if type(ylim) is list else list(ylim)
+    if title is not None:
+        plot_data["title"] = title
+    plot_data["error_markers"] = error_markers or []
     return plot_data
 
 
@@ -182,28 +255,98 @@ def create_project(
 
 def save_project_file(project: dict[str, Any], path: str) -> None:
     """Save project dict to .ppo file.
-    
+
     Args:
         project: Project dict from create_project()
-        path: Output file path (.ppo extension recommended)
+        path: Output file path (.ppo extension recommended).
+            A ".ppo.pkl" extension selects an opt-in pickle format that is
+            much faster to save/load for very large generated projects.
     """
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(project, f, indent=2)
+    if str(path).endswith(".pkl"):
+        with open(path, "wb") as f:
+            pickle.dump(project, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return
+    if orjson is not None:
+        # orjson's C encoder is much faster than stdlib json for large
+        # grouped projects and emits the whole payload as one bytes object.
+        Path(path).write_bytes(
+            orjson.dumps(project, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        # Stream the encoding: iterencode yields chunks the buffered
+        # writer coalesces, so the document is never materialized as one
+        # big string on top of the project dict itself.
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            for chunk in encoder.iterencode(project):
+                f.write(chunk)
 
 
 def load_project_file(path: str) -> dict[str, Any]:
     """Load project dict from .ppo file.
     
     Args:
-        path: Input file path
-    
+        path: Input file path (.ppo for JSON, .ppo.pkl for the pickle format)
+
     Returns:
         Project dict
     """
-    with open(path, "r", encoding="utf-8") as f:
+    if str(path).endswith(".pkl"):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8", buffering=1 << 20) as f:
         return json.load(f)
 
 
+def _grouped_info_arrow(
+    path: str,
+    y: str,
+    groups: list[str],
+    compute_ylim: bool,
+) -> tuple[list[dict[str, Any]], tuple[float, float] | None]:
+    """Expand group combinations and optional shared y-limits with pyarrow.
+
+    Reads only the needed columns straight into an Arrow table and
+    aggregates there, skipping pandas BlockManager construction entirely.
+    Raises ValueError with the same message as expand_groups when the
+    combination cap is exceeded; any other failure (pyarrow missing,
+    non-numeric y column) is surfaced as TypeError/ImportError so the
+    caller can fall back to the pandas path.
+    """
+    import itertools
+
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+
+    cols = list(dict.fromkeys([y, *groups] if compute_ylim else groups))
+    table = pacsv.read_csv(
+        path, convert_options=pacsv.ConvertOptions(include_columns=cols)
+    )
+
+    uniques = [
+        sorted(pc.unique(pc.drop_null(table[g])).to_pylist()) for g in groups
+    ]
+    combos = [dict(zip(groups, vals)) for vals in itertools.product(*uniques)]
+    if len(combos) > 100:
+        raise ValueError("Too many combinations (>100). Reduce groups or categories.")
+
+    ylim: tuple[float, float] | None = None
+    if compute_ylim and len(combos) > 1:
+        agg = table.group_by(groups).aggregate([(y, "min"), (y, "max")])
+        ymin = pc.min(agg.column(f"{y}_min")).as_py()
+        ymax = pc.max(agg.column(f"{y}_max")).as_py()
+        if ymin is None or ymax is None:
+            ylim = (0.0, 1.0)
+        else:
+            try:
+                ylim = (float(ymin), float(ymax))
+            except (TypeError, ValueError) as exc:
+                raise TypeError(f"Non-numeric y column: {y!r}") from exc
+    return combos, ylim
+
+
 # Convenience function for quick project creation
 def create_grouped_plots(
     datasource_id: str,
@@ -268,35 +411,107 @@ def create_grouped_plots(
         >>> # Creates one plot per (species, treatment) combination
         >>> # All plots share the same auto-computed y-axis limits
     """
-    from plot_organizer.services.plot_service import expand_groups, shared_limits, shared_limits_with_sem
-    
-    # Load dataframe to compute limits
-    df = pd.read_csv(dataframe_path)
-    
-    # Expand groups to get filter queries
-    filter_queries = expand_groups(df, groups)
-    
-    # Compute shared limits if not provided
-    if ylim is None and len(filter_queries) > 1:
-        if sem_column:
-            # SEM-aware limits
-            xlim, ylim_tuple = shared_limits_with_sem(
-                df, filter_queries, x, y, sem_column, hue, sem_precomputed
+    from plot_organizer.services.load_service import read_csv_cached
+    from plot_organizer.services.plot_service import expand_groups, shared_limits_with_sem
+
+    # Degenerate case: no group columns means a single ungrouped plot, so
+    # skip the CSV read and limit computation entirely.
+    if not groups:
+        return [
+            create_plot(
+                datasource_id,
+                x=x,
+                y=y,
+                row=start_row,
+                col=start_col,
+                hue=hue,
+                sem_column=sem_column,
+                sem_precomputed=sem_precomputed,
+                filter_query=None,
+                hlines=hlines,
+                vlines=vlines,
+                style_line=style_line,
+                style_marker=style_marker,
+                ylim=ylim,
+                title=None,
+                error_markers=error_markers,
             )
-        else:
-            # Standard limits
-            subsets = []
-            for fq in filter_queries:
-                subset = df
-                for col, val in fq.items():
-                    subset = subset[subset[col] == val]
-                subsets.append(subset)
-            xlim, ylim_tuple = shared_limits(subsets, x, y)
-        
-        # Convert tuple to list for JSON
-        ylim = list(ylim_tuple) if ylim_tuple else None
+        ]
+
+    # In the no-SEM case both the group expansion and the shared y-limits
+    # can be computed directly from an Arrow table, avoiding the pandas
+    # layer entirely.
+    filter_queries = None
+    if sem_column is None:
+        try:
+            filter_queries, arrow_ylim = _grouped_info_arrow(
+                dataframe_path, y, groups, compute_ylim=ylim is None
+            )
+            if arrow_ylim is not None:
+                ylim = list(arrow_ylim)
+        except ValueError:
+            # Combination cap exceeded — same contract as expand_groups
+            raise
+        except Exception:
+            # pyarrow unavailable or y not numeric: use the pandas path
+            filter_queries = None
+
+    if filter_queries is None:
+        # Load dataframe to compute limits (cached, so a later load of the
+        # same datasource, e.g. in the headless export path, reuses this
+        # parse). Only the columns used for grouping/limits are parsed; the
+        # rest of a wide CSV is irrelevant here.
+        needed = {x, y, *groups}
+        if hue:
+            needed.update(hue if isinstance(hue, list) else [hue])
+        if sem_column:
+            needed.add(sem_column)
+        df = read_csv_cached(dataframe_path, usecols=tuple(sorted(needed)))
+
+        # Expand groups to get filter queries
+        filter_queries = expand_groups(df, groups)
+
+        # Compute shared limits if not provided
+        if ylim is None and len(filter_queries) > 1:
+            if sem_column:
+                # SEM-aware limits
+                xlim, ylim_tuple = shared_limits_with_sem(
+                    df, filter_queries, x, y, sem_column, hue, sem_precomputed
+                )
+            else:
+                # Standard limits: aggregate just the y column per group in
+                # one hash-partition pass instead of materializing full-width
+                # subsets per filter query. (The x limits are not used here.)
+                ynum = pd.to_numeric(df[y], errors="coerce")
+                agg = ynum.groupby([df[g] for g in groups], sort=False, observed=True).agg(["min", "max"])
+                ymin, ymax = agg["min"].min(), agg["max"].max()
+                if pd.isna(ymin) or pd.isna(ymax):
+                    # Mirror shared_limits' fallback when everything is empty/NaN
+                    ylim_tuple = (0.0, 1.0)
+                else:
+                    ylim_tuple = (float(ymin), float(ymax))
+
+            # Convert tuple to list for JSON
+            ylim = list(ylim_tuple) if ylim_tuple else None
     
-    # Create plots with auto-positioning
+    # Canonicalize the shared list arguments once; every generated plot then
+    # references the same objects rather than copying them per plot. These
+    # lists are treated as read-only after project construction.
+    ylim = list(ylim) if ylim else None
+    hlines = list(hlines) if hlines else None
+    vlines = list(vlines) if vlines else None
+
+    # Create plots with auto-positioning. Draw the entropy for all plot ids
+    # in one urandom call rather than once per plot.
+    raw_ids = os.urandom(16 * len(filter_queries))
+    ids = [raw_ids[i * 16:(i + 1) * 16].hex() for i in range(len(filter_queries))]
+
+    # Build all titles up front from the already-materialized filter queries
+    titles = [
+        ", ".join(f"{k}={v}" for k, v in fq.items()) if fq else None
+        for fq in filter_queries
+    ]
+
     plots = []
     for i, fq in enumerate(filter_queries):
         # Compute position based on layout
@@ -307,13 +522,6 @@ def create_grouped_plots(
             row = start_row + i
             col = start_col
         
-        # Build title from filter query
-        if fq:
-            title_parts = [f"{k}={v}" for k, v in fq.items()]
-            title = ", ".join(title_parts)
-        else:
-            title = None
-        
         # Create plot
         plot = create_plot(
             datasource_id,
@@ -330,14 +538,30 @@ def create_grouped_plots(
             style_line=style_line,
             style_marker=style_marker,
             ylim=ylim,
-            title=title,
+            title=titles[i],
             error_markers=error_markers,
+            _id=ids[i],
         )
         plots.append(plot)
     
     return plots
 
 
+def _grid_extent(plots: list[dict[str, Any]]) -> tuple[int, int]:
+    """Compute the (rows, cols) needed to fit all plots in one pass."""
+    max_row = 1
+    max_col = 1
+    for p in plots:
+        gp = p["grid_position"]
+        r = gp["row"] + gp["rowspan"]
+        c = gp["col"] + gp["colspan"]
+        if r > max_row:
+            max_row = r
+        if c > max_col:
+            max_col = c
+    return (max_row, max_col)
+
+
 def quick_grouped_project(
     datasource_name: str,
     datasource_path: str,
@@ -387,12 +611,10 @@ def quick_grouped_project(
     
     # Auto-compute grid size
     if plots:
-        max_row = max((p["grid_position"]["row"] + p["grid_position"]["rowspan"] for p in plots), default=1)
-        max_col = max((p["grid_position"]["col"] + p["grid_position"]["colspan"] for p in plots), default=1)
-        grid_size = (max_row, max_col)
+        grid_size = _grid_extent(plots)
     else:
         grid_size = (2, 3)
-    
+
     return create_project(grid_size, [ds], plots)
 
 
@@ -416,15 +638,14 @@ def quick_project(
     ds = create_datasource(datasource_name, datasource_path)
     
     # Auto-fill datasource_id in plots
+    ds_id = ds["id"]
     for plot in plots:
-        if "datasource_id" not in plot or not plot["datasource_id"]:
-            plot["datasource_id"] = ds["id"]
+        if not plot.get("datasource_id"):
+            plot["datasource_id"] = ds_id
     
     # Auto-compute grid size if not provided
     if grid_size is None:
-        max_row = max((p["grid_position"]["row"] + p["grid_position"]["rowspan"] for p in plots), default=1)
-        max_col = max((p["grid_position"]["col"] + p["grid_position"]["colspan"] for p in plots), default=1)
-        grid_size = (max_row, max_col)
-    
+        grid_size = _grid_extent(plots)
+
     return create_project(grid_size, [ds], plots)
 
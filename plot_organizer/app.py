@@ -53,6 +53,12 @@ def run() -> int:
         default=150,
         help="Export DPI for PNG (default: 150)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker threads for plot reconstruction in headless mode (default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -71,9 +77,10 @@ def run() -> int:
             fmt=args.format,
             width=args.width,
             height=args.height,
-            dpi=args.dpi
+            dpi=args.dpi,
+            jobs=args.jobs
         )
-    
+
     # GUI mode
     app = QApplication(sys.argv)
     window = MainWindow()
@@ -109,9 +116,14 @@ def run_headless_export(
     fmt: str = "pdf",
     width: float = 11.0,
     height: float = 8.5,
-    dpi: int = 150
+    dpi: int = 150,
+    jobs: int = 1
 ) -> int:
-    """Run in headless mode: load project, export, and exit without showing GUI."""
+    """Run in headless mode: load project, export, and exit without showing GUI.
+
+    With jobs > 1, plot reconstruction runs in a thread pool; Matplotlib's
+    Agg rendering releases the GIL, so tiles render in parallel.
+    """
     from plot_organizer.services.project_service import load_workspace
     from plot_organizer.services.load_service import load_csv_to_datasource
     from plot_organizer.services.export_service import export_grid
@@ -145,28 +157,40 @@ def run_headless_export(
         cols = grid_info.get("cols", 3)
         grid_board = GridBoard(rows=rows, cols=cols, parent=None)
         
-        # Reconstruct plots
-        plot_count = 0
+        # Collect reconstruction tasks: (tile, dataframe, plot_data, position)
+        tasks = []
         for plot_data in workspace.get("plots", []):
             ds_id = plot_data.get("datasource_id")
             if not ds_id or ds_id not in datasources:
                 continue
-            
+
             ds = datasources[ds_id]
             grid_pos = plot_data.get("grid_position", {})
             row = grid_pos.get("row", 0)
             col = grid_pos.get("col", 0)
             rowspan = grid_pos.get("rowspan", 1)
             colspan = grid_pos.get("colspan", 1)
-            
+
             tile = grid_board.tile_at(row, col)
             if tile:
-                tile.set_plot_from_data(ds.dataframe, plot_data)
-                if rowspan > 1 or colspan > 1:
-                    grid_board.move_plot(row, col, row, col, rowspan, colspan)
-                plot_count += 1
-        
-        print(f"  Reconstructed {plot_count} plots")
+                tasks.append((tile, ds.dataframe, plot_data, row, col, rowspan, colspan))
+
+        # Render tiles (each owns its own figure and only reads the dataframe,
+        # so they can render concurrently)
+        if jobs > 1 and len(tasks) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                list(executor.map(lambda t: t[0].set_plot_from_data(t[1], t[2]), tasks))
+        else:
+            for tile, dataframe, plot_data, *_ in tasks:
+                tile.set_plot_from_data(dataframe, plot_data)
+
+        # Apply spanning on the main thread (grid mutation is not thread-safe)
+        for tile, _, _, row, col, rowspan, colspan in tasks:
+            if rowspan > 1 or colspan > 1:
+                grid_board.move_plot(row, col, row, col, rowspan, colspan)
+
+        print(f"  Reconstructed {len(tasks)} plots")
         
         # Export
         print(f"Exporting to: {output_path}")
@@ -176,11 +200,12 @@ def run_headless_export(
             fmt=fmt,
             width_in=width,
             height_in=height,
-            dpi=dpi
+            dpi=dpi,
+            jobs=jobs
         )
         print(f"Export successful!")
         return 0
-    
+
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         import traceback
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnSchema:
     name: str
     dtype: str
@@ -15,7 +16,7 @@ class ColumnSchema:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSource:
     id: str
     name: str
@@ -24,7 +25,7 @@ class DataSource:
     schema: list[ColumnSchema]
 
 
-@dataclass
+@dataclass(slots=True)
 class PlotSpec:
     id: str
     datasource_id: str
@@ -37,7 +38,7 @@ class PlotSpec:
     style_overrides: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlotInstance:
     id: str
     spec_id: str
@@ -45,12 +46,14 @@ class PlotInstance:
     empty: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class GridLayout:
     rows: int
     cols: int
     # For simplicity of persistence and decoupling the view layer, store plot instance IDs in cells
-    # rather than object references.
-    cells: dict[tuple[int, int], str | None] = field(default_factory=dict)
+    # rather than object references. Backed by a (rows, cols) object ndarray:
+    # cells[r, c] is a C-level strided load versus hashing an int tuple per
+    # lookup with a dict keyed on (row, col).
+    cells: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=object))
 
 
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, TYPE_CHECKING
+import hashlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Optional, TYPE_CHECKING
 
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for export
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
+import numpy as np
 import pandas as pd
 from matplotlib.ticker import AutoMinorLocator
 
+from plot_organizer.services.plot_service import apply_filter_query, grouped_mean, lttb_indices
+
 if TYPE_CHECKING:
     from plot_organizer.ui.grid_board import GridBoard, PlotTile
 
@@ -20,139 +27,274 @@ def export_grid(
     width_in: float = 11.0,
     height_in: float = 8.5,
     dpi: int = 150,
+    jobs: int = 1,
 ) -> None:
     """Export the entire grid layout to a file.
-    
+
     Creates a new matplotlib figure with GridSpec matching the grid layout,
     then re-renders each plot into its corresponding subplot.
+
+    With jobs > 1 the per-tile curve aggregation (the pandas groupby work)
+    runs in a process pool; only plain DataFrames and ndarrays cross the
+    process boundary, never Figure or Qt objects. Drawing stays on the
+    main process since matplotlib artists are not picklable.
     """
     rows = grid_board._rows
     cols = grid_board._cols
-    
-    # Create figure with GridSpec
-    fig = plt.figure(figsize=(width_in, height_in))
-    gs = GridSpec(rows, cols, figure=fig, hspace=0.3, wspace=0.3)
-    
-    # Track which cells have been processed (for spanning plots)
-    processed = set()
-    
-    # Render each plot
-    for r in range(rows):
-        for c in range(cols):
-            if (r, c) in processed:
-                continue
-            
-            tile = grid_board.tile_at(r, c)
-            if tile is None or tile.is_empty():
-                continue
-            
-            # Get position and span
-            pos = grid_board.find_tile_position(tile)
-            if pos is None:
-                continue
-            
-            tile_row, tile_col, rowspan, colspan = pos
-            
-            # Mark cells as processed
-            for dr in range(rowspan):
-                for dc in range(colspan):
-                    processed.add((tile_row + dr, tile_col + dc))
-            
-            # Skip if not at the starting position
-            if (r, c) != (tile_row, tile_col):
-                continue
-            
-            # Create subplot with span
-            ax = fig.add_subplot(gs[tile_row:tile_row+rowspan, tile_col:tile_col+colspan])
-            
-            # Re-render the plot
-            _render_plot_to_ax(tile, ax)
-    
+
+    # Create figure with GridSpec. Constrained layout solves the layout
+    # once up front; bbox_inches='tight' would instead render the whole
+    # artist tree twice (once to measure, once to write).
+    fig = plt.figure(figsize=(width_in, height_in), layout="constrained")
+    gs = GridSpec(rows, cols, figure=fig)
+
+    # One pass over the unique tiles; no per-cell scan or processed set
+    tiles = grid_board.unique_tiles()
+
+    # Compute the curves for every tile up front, in parallel when asked
+    curves_by_index: dict[int, list[dict[str, Any]]] = {}
+    if jobs > 1 and len(tiles) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                i: executor.submit(
+                    _compute_curves,
+                    _tile_plot_df(tile),
+                    tile._x,
+                    tile._y,
+                    tile._hue,
+                    tile._sem_column,
+                    tile._sem_precomputed,
+                )
+                for i, (tile, *_pos) in enumerate(tiles)
+                if tile._df is not None
+            }
+            curves_by_index = {i: fut.result() for i, fut in futures.items()}
+
+    for i, (tile, tile_row, tile_col, rowspan, colspan) in enumerate(tiles):
+        # Create subplot with span
+        ax = fig.add_subplot(gs[tile_row:tile_row+rowspan, tile_col:tile_col+colspan])
+
+        # Re-render the plot; cap curve vertices at the figure's pixel width
+        _render_plot_to_ax(
+            tile, ax, curves=curves_by_index.get(i), max_points=int(width_in * dpi)
+        )
+
     # Save figure
-    fig.savefig(out_path, format=fmt, dpi=dpi, bbox_inches='tight')
+    fig.savefig(out_path, format=fmt, dpi=dpi)
     plt.close(fig)
 
 
-def _render_plot_to_ax(tile: "PlotTile", ax) -> None:
-    """Render a PlotTile's data to a matplotlib axis."""
-    import numpy as np
-    
-    if tile._df is None:
+def _tile_plot_df(tile: "PlotTile") -> pd.DataFrame:
+    """Return the tile's filtered frame, recomputing it if not cached."""
+    if tile._plot_df is not None:
+        return tile._plot_df
+    return apply_filter_query(tile._df, tile._filter_query)
+
+
+def _iter_hue_groups(plot_df: pd.DataFrame, hue):
+    """Yield (label, subframe) per hue value as contiguous slices.
+
+    For a single hue column this sorts the frame by categorical codes
+    once and slices at the code boundaries — no GroupBy machinery, since
+    only the row subsets are needed, not an aggregation. Labels come out
+    in category (sorted) order, matching groupby. Multi-column hue falls
+    back to groupby for its tuple-key semantics.
+    """
+    if not isinstance(hue, str):
+        for key, sub in plot_df.groupby(hue, observed=True):
+            yield str(key), sub
         return
-    
-    df = tile._df
-    x, y, hue = tile._x, tile._y, tile._hue
-    sem_column = tile._sem_column
-    sem_precomputed = tile._sem_precomputed
-    filter_query = tile._filter_query
+    cat = pd.Categorical(plot_df[hue])
+    codes = cat.codes
+    valid = codes >= 0  # groupby drops NaN keys; match that
+    if not valid.all():
+        plot_df = plot_df[valid]
+        codes = codes[valid]
+    order = np.argsort(codes, kind="stable")
+    sorted_df = plot_df.iloc[order]
+    codes = codes[order]
+    bounds = np.concatenate(
+        ([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)])
+    )
+    for i in range(len(bounds) - 1):
+        start, stop = bounds[i], bounds[i + 1]
+        if start == stop:
+            continue
+        yield str(cat.categories[codes[start]]), sorted_df.iloc[start:stop]
+
+
+def _compute_curves(
+    plot_df: pd.DataFrame,
+    x: str,
+    y: str,
+    hue: Optional[str],
+    sem_column: Optional[str],
+    sem_precomputed: bool,
+    agg_cache: dict[tuple, pd.DataFrame] | None = None,
+) -> list[dict[str, Any]]:
+    """Aggregate a tile's data into plain plot arrays.
+
+    Pure pandas/numpy, so it is picklable and safe to run in a worker
+    process. Each returned dict holds x/y arrays, the legend label and
+    optional SEM band bounds; ``_draw_curves`` turns them into artists.
+    """
+    if hue:
+        return [
+            _compute_curve(sub, x, y, sem_column, sem_precomputed, label, agg_cache)
+            for label, sub in _iter_hue_groups(plot_df, hue)
+        ]
+    return [_compute_curve(plot_df, x, y, sem_column, sem_precomputed, None, agg_cache)]
+
+
+def _compute_curve(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    sem_column: Optional[str],
+    sem_precomputed: bool,
+    label: Optional[str],
+    agg_cache: dict[tuple, pd.DataFrame] | None,
+) -> dict[str, Any]:
+    """Aggregate one (hue-)subset; mirrors PlotTile's aggregation logic."""
+    sem_lo = sem_hi = None
+    if sem_column and sem_column in data.columns:
+        if sem_precomputed:
+            # Pre-computed SEM: aggregate by x
+            key = ("pre", x, y, sem_column, label)
+            agg = agg_cache.get(key) if agg_cache is not None else None
+            if agg is None:
+                agg = data.groupby(x, as_index=False, observed=True)[[y, sem_column]].mean()
+                if agg_cache is not None:
+                    agg_cache[key] = agg
+            xs = agg[x].to_numpy()
+            ys = agg[y].to_numpy()
+            sems = agg[sem_column].to_numpy(dtype=np.float64)
+            if not np.isnan(sems).all():
+                sem_lo = ys - sems
+                sem_hi = ys + sems
+        else:
+            # Computed SEM: group by sem_column first, then by x
+            key = ("sem", x, y, sem_column, label)
+            stats = agg_cache.get(key) if agg_cache is not None else None
+            if stats is None:
+                grouped = data.groupby([sem_column, x], as_index=False, sort=False, observed=True)[y].mean()
+                stats = grouped.groupby(x, observed=True)[y].agg(['mean', 'sem']).reset_index()
+                stats.columns = [x, 'mean_y', 'sem_y']
+                if agg_cache is not None:
+                    agg_cache[key] = stats
+            xs = stats[x].to_numpy()
+            ys = stats['mean_y'].to_numpy()
+            sems = stats['sem_y'].to_numpy(dtype=np.float64)
+            if not np.isnan(sems).all():
+                sem_lo = ys - sems
+                sem_hi = ys + sems
+    else:
+        key = ("mean", x, y, label)
+        agg = agg_cache.get(key) if agg_cache is not None else None
+        if agg is None:
+            agg = data.groupby(x, as_index=False, observed=True)[y].mean()
+            if agg_cache is not None:
+                agg_cache[key] = agg
+        xs = agg[x].to_numpy()
+        ys = agg[y].to_numpy()
+    return {"x": xs, "y": ys, "label": label, "sem_lo": sem_lo, "sem_hi": sem_hi}
+
+
+def _downsample_curve(curve: dict[str, Any], max_points: int) -> dict[str, Any]:
+    """Reduce a dense curve to ~max_points vertices via LTTB.
+
+    Only kicks in for numeric data well above the target resolution;
+    below 2×max_points the savings are not worth perturbing the samples.
+    SEM bounds are subset with the same indices to stay aligned.
+    """
+    xs, ys = curve["x"], curve["y"]
+    if len(xs) < 2 * max_points:
+        return curve
+    if not (np.issubdtype(np.asarray(xs).dtype, np.number)
+            and np.issubdtype(np.asarray(ys).dtype, np.number)):
+        return curve
+    idx = lttb_indices(xs, ys, max_points)
+    out = dict(curve)
+    out["x"] = xs[idx]
+    out["y"] = ys[idx]
+    if curve["sem_lo"] is not None:
+        out["sem_lo"] = curve["sem_lo"][idx]
+        out["sem_hi"] = curve["sem_hi"][idx]
+    return out
+
+
+def _draw_curves(
+    tile: "PlotTile", ax, curves: list[dict[str, Any]], max_points: Optional[int] = None
+) -> None:
+    """Draw precomputed curves onto an axis; must run on the main process."""
     style_line = tile._style_line
     style_marker = tile._style_marker
-    
-    # Get format string for plotting
     if style_line and style_marker:
         fmt = '-o'  # Line with markers
     elif style_marker:
         fmt = 'o'   # Markers only
     else:
         fmt = '-'   # Line only (default)
-    
-    # Apply filter if present
-    plot_df = df
-    if filter_query:
-        for col, val in filter_query.items():
-            plot_df = plot_df[plot_df[col] == val]
-    
-    # Helper function to plot with SEM (same logic as PlotTile._plot_with_sem)
-    def plot_with_sem(data, label=None):
-        if sem_column and sem_column in data.columns:
-            if sem_precomputed:
-                # Pre-computed SEM: aggregate by x
-                agg_data = data.groupby(x, as_index=False).agg({
-                    y: 'mean',
-                    sem_column: 'mean'
-                })
-                
-                line = ax.plot(agg_data[x], agg_data[y], fmt, label=label)[0]
-                
-                if agg_data[sem_column].notna().any():
-                    color = line.get_color()
-                    ax.fill_between(
-                        agg_data[x],
-                        agg_data[y] - agg_data[sem_column],
-                        agg_data[y] + agg_data[sem_column],
-                        alpha=0.2,
-                        color=color
-                    )
-            else:
-                # Computed SEM: group by sem_column first, then by x
-                grouped = data.groupby([sem_column, x], as_index=False)[y].mean()
-                # Compute mean and SEM across sem_column groups
-                stats = grouped.groupby(x)[y].agg(['mean', 'sem']).reset_index()
-                stats.columns = [x, 'mean_y', 'sem_y']
-                
-                line = ax.plot(stats[x], stats['mean_y'], fmt, label=label)[0]
-                
-                if stats['sem_y'].notna().any():
-                    color = line.get_color()
-                    ax.fill_between(
-                        stats[x],
-                        stats['mean_y'] - stats['sem_y'],
-                        stats['mean_y'] + stats['sem_y'],
-                        alpha=0.2,
-                        color=color
-                    )
-        else:
-            agg_data = data.groupby(x, as_index=False)[y].mean()
-            ax.plot(agg_data[x], agg_data[y], fmt, label=label)
-    
-    # Apply aggregation with SEM
-    if hue:
-        for key, sub in plot_df.groupby(hue):
-            plot_with_sem(sub, label=str(key))
+
+    for curve in curves:
+        if max_points:
+            curve = _downsample_curve(curve, max_points)
+        line = ax.plot(curve["x"], curve["y"], fmt, label=curve["label"])[0]
+        # Rasterize only the data artists: for vector formats (pdf/svg) the
+        # axes, labels and legend stay vector while dense curves become a
+        # single image, shrinking the file and the savefig time. Raster
+        # backends (png) ignore the flag.
+        line.set_rasterized(True)
+        if curve["sem_lo"] is not None:
+            band = ax.fill_between(
+                curve["x"],
+                curve["sem_lo"],
+                curve["sem_hi"],
+                alpha=0.2,
+                color=line.get_color(),
+            )
+            band.set_rasterized(True)
+    if tile._hue:
         ax.legend(loc="best", fontsize='small')
-    else:
-        plot_with_sem(plot_df)
-    
+
+
+def _render_plot_to_ax(
+    tile: "PlotTile",
+    ax,
+    curves: list[dict[str, Any]] | None = None,
+    max_points: Optional[int] = None,
+) -> None:
+    """Render a PlotTile's data to a matplotlib axis.
+
+    Accepts precomputed curves (from _compute_curves, possibly produced in
+    a worker process); when absent they are computed inline, sharing the
+    tile's aggregation cache so exports skip recomputation. max_points
+    caps the vertices drawn per curve (LTTB downsampling).
+    """
+    if tile._df is None:
+        return
+
+    x, y = tile._x, tile._y
+
+    # Most dashboard tiles have no filter, hue, SEM, reference lines or
+    # error markers; dispatch those straight to the specialized renderer
+    if curves is None and _is_simple_tile(tile):
+        _render_simple_fast(tile, ax, max_points)
+        return
+
+    if curves is None:
+        curves = _compute_curves(
+            _tile_plot_df(tile),
+            x,
+            y,
+            tile._hue,
+            tile._sem_column,
+            tile._sem_precomputed,
+            agg_cache=tile._agg_cache,
+        )
+
+    _draw_curves(tile, ax, curves, max_points=max_points)
+
     # Get title from the tile's figure if it has one
     if tile.figure.axes:
         orig_ax = tile.figure.axes[0]
@@ -182,6 +324,61 @@ def _render_plot_to_ax(tile: "PlotTile", ax) -> None:
     _render_error_markers_to_ax(tile, ax)
 
 
+def _is_simple_tile(tile: "PlotTile") -> bool:
+    """True when a tile needs only a single mean curve and axis labels."""
+    return (
+        not tile._filter_query
+        and not tile._hue
+        and not tile._sem_column
+        and not tile._hlines
+        and not tile._vlines
+        and not getattr(tile, "_error_markers", None)
+    )
+
+
+def _render_simple_fast(tile: "PlotTile", ax, max_points: Optional[int] = None) -> None:
+    """Render a bare tile: one cached aggregation, one plot call.
+
+    Skips the curve-dict machinery, the SEM branches and the reference
+    line / error marker passes that _render_plot_to_ax has to consider.
+    """
+    df = tile._plot_df if tile._plot_df is not None else tile._df
+    x, y = tile._x, tile._y
+
+    # Sort-free numpy aggregation (factorize + bincount) instead of a
+    # full pandas groupby; cached on the tile like the other aggregations
+    key = ("mean_np", x, y)
+    cached = tile._agg_cache.get(key)
+    if cached is None:
+        try:
+            cached = grouped_mean(df[x].to_numpy(), df[y].to_numpy())
+        except (TypeError, ValueError):
+            # Non-numeric y: let pandas handle the coercion semantics
+            agg = tile._agg_mean(df, x, y, None)
+            cached = (agg[x].to_numpy(), agg[y].to_numpy())
+        tile._agg_cache[key] = cached
+    xs, ys = cached
+    curve = {"x": xs, "y": ys, "label": None, "sem_lo": None, "sem_hi": None}
+    if max_points:
+        curve = _downsample_curve(curve, max_points)
+    line = ax.plot(curve["x"], curve["y"], tile._get_plot_format())[0]
+    line.set_rasterized(True)
+
+    if tile.figure.axes:
+        orig_ax = tile.figure.axes[0]
+        if orig_ax.get_title():
+            ax.set_title(orig_ax.get_title(), fontsize='small', pad=2)
+
+    ax.set_xlabel(x, fontsize='small')
+    ax.set_ylabel(y, fontsize='small')
+    ax.tick_params(labelsize='small')
+    ax.xaxis.set_minor_locator(AutoMinorLocator(5))
+    ax.tick_params(axis='x', which='minor', length=3, labelbottom=False)
+
+    if tile._ylim is not None:
+        ax.set_ylim(tile._ylim)
+
+
 def _render_error_markers_to_ax(tile: "PlotTile", ax) -> None:
     """Render error bar markers from a PlotTile onto the given axis.
     
@@ -279,6 +476,38 @@ def _render_error_markers_to_ax(tile: "PlotTile", ax) -> None:
         )
 
 
+# Rendered output bytes keyed on (df fingerprint, plot spec, format);
+# script-driven exports frequently re-export identical plots and artist
+# construction plus rasterization dominate the export time.
+_RENDER_CACHE: dict[tuple, bytes] = {}
+_RENDER_CACHE_MAX = 32
+
+# One reusable Figure/Axes pair per figure size: figure construction
+# (axes, spines, ticks, transforms) costs several ms per call, which
+# dominates batch single-exports. ax.clear() resets state between plots.
+_FIG_POOL: dict[tuple[float, float], tuple["plt.Figure", Any]] = {}
+
+
+def _df_fingerprint(df: pd.DataFrame) -> bytes:
+    """Fast content hash of a DataFrame for figure-cache keys."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+
+
+def _plot_agg(ax, agg: pd.DataFrame, x: str, y: str, max_points: int, label=None) -> None:
+    """Plot one aggregated mean curve, downsampled to the target width.
+
+    Module-level (rather than a closure in export_single) so no function
+    object and cells are rebuilt per export call.
+    """
+    curve = _downsample_curve(
+        {"x": agg[x].to_numpy(), "y": agg[y].to_numpy(),
+         "label": label, "sem_lo": None, "sem_hi": None},
+        max_points,
+    )
+    ax.plot(curve["x"], curve["y"], label=label)
+
+
 def export_single(
     df: pd.DataFrame,
     x: str,
@@ -291,24 +520,50 @@ def export_single(
     height_in: float = 3.0,
     dpi: int = 150,
 ) -> None:
-    """Export a single plot to a file."""
-    fig, ax = plt.subplots(figsize=(width_in, height_in))
-    
-    if hue:
-        for key, sub in df.groupby(hue):
-            agg_sub = sub.groupby(x, as_index=False)[y].mean()
-            ax.plot(agg_sub[x], agg_sub[y], label=str(key))
-        ax.legend(loc="best")
-    else:
-        agg_df = df.groupby(x, as_index=False)[y].mean()
-        ax.plot(agg_df[x], agg_df[y])
-    
-    if title:
-        ax.set_title(title)
-    ax.set_xlabel(x)
-    ax.set_ylabel(y)
-    
-    fig.savefig(out_path, format=fmt, dpi=dpi, bbox_inches='tight')
-    plt.close(fig)
+    """Export a single plot to a file.
+
+    Rendered bytes are cached on the data fingerprint and plot spec, so
+    re-exporting an unchanged plot (e.g. to a different path) skips both
+    artist construction and rasterization. Cache misses draw into a
+    pooled Figure per size rather than constructing a new one per call.
+    """
+    key = (_df_fingerprint(df), x, y, hue, title, width_in, height_in, fmt, dpi)
+    data = _RENDER_CACHE.get(key)
+
+    if data is None:
+        pooled = _FIG_POOL.get((width_in, height_in))
+        if pooled is None:
+            fig, ax = plt.subplots(figsize=(width_in, height_in), layout="constrained")
+            # Deregister from pyplot; the pool keeps the Figure alive
+            plt.close(fig)
+            _FIG_POOL[(width_in, height_in)] = (fig, ax)
+        else:
+            fig, ax = pooled
+            ax.clear()
+        max_points = int(width_in * dpi)
+
+        if hue:
+            for hue_key, sub in df.groupby(hue, observed=True):
+                agg_sub = sub.groupby(x, as_index=False, observed=True)[y].mean()
+                _plot_agg(ax, agg_sub, x, y, max_points, str(hue_key))
+            ax.legend(loc="best")
+        else:
+            _plot_agg(ax, df.groupby(x, as_index=False, observed=True)[y].mean(), x, y, max_points)
+
+        if title:
+            ax.set_title(title)
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+
+        # Render to an in-memory buffer so the bytes can be cached and
+        # the file written in one syscall
+        buf = io.BytesIO()
+        fig.savefig(buf, format=fmt, dpi=dpi)
+        data = buf.getvalue()
+        if len(_RENDER_CACHE) >= _RENDER_CACHE_MAX:
+            _RENDER_CACHE.clear()
+        _RENDER_CACHE[key] = data
+
+    Path(out_path).write_bytes(data)
 
 
@@ -1,10 +1,134 @@
 from __future__ import annotations
 
 import itertools
+import weakref
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+try:
+    import numba  # noqa: F401
+    # pandas' numba engine beats the default cython path on the repeated
+    # small-group mean reductions done per hue/filter combination
+    _NUMBA_GROUPBY_KW: dict[str, Any] = {
+        "engine": "numba",
+        "engine_kwargs": {"nopython": True, "nogil": True, "parallel": True},
+    }
+except ImportError:  # pragma: no cover - optional dependency
+    _NUMBA_GROUPBY_KW = {}
+
+
+def apply_filter_query(df: pd.DataFrame, filter_query: dict[str, Any] | None) -> pd.DataFrame:
+    """Apply equality filters with one combined boolean mask.
+
+    Builds a single mask over all filter columns and indexes once, instead
+    of allocating an intermediate DataFrame per filter as chained
+    ``df[df[col] == val]`` does.
+    """
+    if not filter_query:
+        return df
+    mask = np.ones(len(df), dtype=bool)
+    for col, val in filter_query.items():
+        mask &= (df[col] == val).to_numpy()
+    return df[mask]
+
+
+# Coerced float64 columns keyed on the identity of the source values;
+# limits are recomputed on every layout change and to_numeric on a large
+# object column is an O(N) allocation each time.
+_NUMERIC_VIEW_CACHE: dict[tuple[int, Any], tuple[Any, np.ndarray]] = {}
+_NUMERIC_VIEW_CACHE_MAX = 64
+
+
+def _numeric_view(series: pd.Series) -> np.ndarray:
+    """Float64 array of a Series for limit scans, skipping repeat coercion.
+
+    Already-numeric columns are returned without copying. Other columns go
+    through to_numeric once; the result is memoized against the identity
+    of the underlying values, held via weakref so the cache never keeps
+    the source alive and a recycled id is detected before reuse.
+    """
+    if series.dtype.kind in "fiu":
+        return series.to_numpy(dtype=np.float64, copy=False)
+    values = series._values
+    key = (id(values), series.name)
+    hit = _NUMERIC_VIEW_CACHE.get(key)
+    if hit is not None:
+        ref, arr = hit
+        if ref() is values:
+            return arr
+    arr = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+    if len(_NUMERIC_VIEW_CACHE) >= _NUMERIC_VIEW_CACHE_MAX:
+        _NUMERIC_VIEW_CACHE.clear()
+    try:
+        _NUMERIC_VIEW_CACHE[key] = (weakref.ref(values), arr)
+    except TypeError:  # pragma: no cover - some array types reject weakref
+        pass
+    return arr
+
+
+def grouped_mean(xv: np.ndarray, yv: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Mean of y per unique x via factorize + bincount.
+
+    Skips the full groupby machinery (hash table, BlockManager result
+    construction) for the plain one-key mean: factorize the keys once,
+    then two bincount passes over the codes. Matches groupby semantics —
+    NaN keys and NaN y values are excluded, uniques come back sorted so
+    line plots stay monotonic in x. Raises TypeError/ValueError for
+    non-numeric y; callers fall back to pandas.
+    """
+    codes, uniques = pd.factorize(xv, sort=True)
+    yv = np.asarray(yv, dtype=np.float64)
+    valid = (codes >= 0) & ~np.isnan(yv)
+    codes = codes[valid]
+    sums = np.bincount(codes, weights=yv[valid], minlength=len(uniques))
+    counts = np.bincount(codes, minlength=len(uniques))
+    with np.errstate(invalid="ignore"):
+        means = sums / counts
+    present = counts > 0
+    return np.asarray(uniques)[present], means[present]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling; returns kept indices.
+
+    Picks the point per bucket that forms the largest triangle with the
+    previously kept point and the next bucket's average, which preserves
+    the visual envelope of a dense curve with far fewer vertices. The
+    first and last points are always kept. Returning indices (rather than
+    values) lets callers subset companion arrays, e.g. SEM bounds, with
+    the same selection.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    xf = np.asarray(x, dtype=np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+    sampled = np.empty(n_out, dtype=np.intp)
+    sampled[0] = 0
+    sampled[-1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        if avg_end > end:
+            avg_x = xf[end:avg_end].mean()
+            avg_y = yf[end:avg_end].mean()
+        else:
+            avg_x = xf[n - 1]
+            avg_y = yf[n - 1]
+        # Twice the triangle area for each candidate in the bucket
+        area = np.abs(
+            (xf[a] - avg_x) * (yf[start:end] - yf[a])
+            - (xf[a] - xf[start:end]) * (avg_y - yf[a])
+        )
+        a = start + int(np.argmax(area))
+        sampled[i + 1] = a
+    return sampled
+
 
 def expand_groups(df: pd.DataFrame, groups: list[str]) -> list[dict[str, Any]]:
     """Return concrete equality filter dictionaries for the Cartesian product of group columns.
@@ -13,9 +137,16 @@ def expand_groups(df: pd.DataFrame, groups: list[str]) -> list[dict[str, Any]]:
     """
     if not groups:
         return [{}]
-    uniques: list[list[Any]] = [
-        sorted(df[g].dropna().unique().tolist()) for g in groups
-    ]
+    uniques: list[list[Any]] = []
+    for g in groups:
+        col = df[g]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            # Categories are already deduplicated and sorted; no O(N) scan
+            uniques.append(list(col.cat.categories))
+        else:
+            vals = pd.unique(col.to_numpy())
+            vals = vals[~pd.isna(vals)]
+            uniques.append(sorted(vals.tolist()))
     combos = [dict(zip(groups, vals)) for vals in itertools.product(*uniques)]
     if len(combos) > 100:
         raise ValueError("Too many combinations (>100). Reduce groups or categories.")
@@ -30,25 +161,83 @@ def shared_limits(
     Non-numeric columns are coerced with to_numeric (errors coerced to NaN) to
     provide a consistent numeric range for plotting comparisons.
     """
-    xmins: list[float] = []
-    xmaxs: list[float] = []
-    ymins: list[float] = []
-    ymaxs: list[float] = []
-    for sub in subsets:
-        if sub is None or sub.empty:
-            continue
-        xnum = pd.to_numeric(sub[x], errors="coerce")
-        ynum = pd.to_numeric(sub[y], errors="coerce")
-        if xnum.notna().any():
-            xmins.append(float(xnum.min()))
-            xmaxs.append(float(xnum.max()))
-        if ynum.notna().any():
-            ymins.append(float(ynum.min()))
-            ymaxs.append(float(ynum.max()))
-    if not xmins or not ymins:
+    live = [sub for sub in subsets if sub is not None and not sub.empty]
+    if not live:
         # Fallback to zeros if everything is empty/NaN to avoid crashes upstream
         return (0.0, 1.0), (0.0, 1.0)
-    return (min(xmins), max(xmaxs)), (min(ymins), max(ymaxs))
+    # One concatenated buffer per axis and a single nanmin/nanmax scan,
+    # rather than Python-level min/max bookkeeping per subset
+    xs = np.concatenate([_numeric_view(sub[x]) for sub in live])
+    ys = np.concatenate([_numeric_view(sub[y]) for sub in live])
+    if np.isnan(xs).all() or np.isnan(ys).all():
+        return (0.0, 1.0), (0.0, 1.0)
+    return (
+        (float(np.nanmin(xs)), float(np.nanmax(xs))),
+        (float(np.nanmin(ys)), float(np.nanmax(ys))),
+    )
+
+
+class AggContext:
+    """Shares filtered subsets and group indices across aggregation passes.
+
+    The shared-limits computation and the per-tile renders filter the same
+    DataFrame by the same queries, rebuild the composite hue column and
+    regroup from scratch; pandas redoes the O(N) hash/partition work on
+    every call. One AggContext per source frame materializes each filtered
+    subset (and its GroupBy, whose group_info is computed lazily and
+    cached by pandas) exactly once and hands the identical objects to
+    every consumer.
+    """
+
+    def __init__(self, df: pd.DataFrame, hue: str | list[str] | None = None):
+        self.df = df
+        self.hue = hue
+        self._base: pd.DataFrame | None = None
+        self._subsets: dict[tuple, pd.DataFrame] = {}
+        self._groupbys: dict[tuple, Any] = {}
+
+    @property
+    def actual_hue(self) -> str | None:
+        """The concrete hue column name (composite for multi-column hue)."""
+        if isinstance(self.hue, list) and len(self.hue) > 0:
+            return "__composite_hue__"
+        if isinstance(self.hue, str):
+            return self.hue
+        return None
+
+    def base(self) -> pd.DataFrame:
+        """The source frame, with the composite hue column when needed."""
+        if self._base is None:
+            if isinstance(self.hue, list) and len(self.hue) > 0:
+                base = self.df.copy()
+                hue_cols = self.hue
+                base["__composite_hue__"] = base.apply(
+                    lambda row: ", ".join(f"{col}={row[col]}" for col in hue_cols),
+                    axis=1,
+                )
+                self._base = base
+            else:
+                self._base = self.df
+        return self._base
+
+    def subset(self, filter_query: dict[str, Any] | None) -> pd.DataFrame:
+        """The base frame filtered by filter_query, computed once per query."""
+        key = tuple(sorted(filter_query.items())) if filter_query else ()
+        sub = self._subsets.get(key)
+        if sub is None:
+            sub = apply_filter_query(self.base(), filter_query)
+            self._subsets[key] = sub
+        return sub
+
+    def groupby(self, filter_query: dict[str, Any] | None, keys: str | list[str]):
+        """A cached GroupBy of the filtered subset over the given keys."""
+        fq_key = tuple(sorted(filter_query.items())) if filter_query else ()
+        gb_key = (fq_key, keys if isinstance(keys, str) else tuple(keys))
+        gb = self._groupbys.get(gb_key)
+        if gb is None:
+            gb = self.subset(filter_query).groupby(keys, observed=True)
+            self._groupbys[gb_key] = gb
+        return gb
 
 
 def shared_limits_with_sem(
@@ -59,55 +248,46 @@ def shared_limits_with_sem(
     sem_column: str | None,
     hue: str | list[str] | None = None,
     sem_precomputed: bool = False,
+    ctx: AggContext | None = None,
 ) -> tuple[tuple[float, float], tuple[float, float]]:
     """Compute shared x/y limits accounting for SEM aggregation.
-    
+
     When sem_column is provided, computes limits based on the aggregated
     means ± SEM rather than raw data values. This ensures the y-axis is
     scaled appropriately for what will actually be plotted.
+
+    Callers that go on to render the same subsets (e.g. grouped plot
+    creation in the UI) can pass an AggContext so the filtered frames are
+    built once and shared.
     """
     xmins: list[float] = []
     xmaxs: list[float] = []
     ymins: list[float] = []
     ymaxs: list[float] = []
-    
-    # Create composite hue column if hue is a list
-    df_to_use = df
-    actual_hue = None
-    if hue:
-        if isinstance(hue, list) and len(hue) > 0:
-            # Create composite column with format: Col1=val1, Col2=val2
-            df_to_use = df.copy()
-            composite_name = "__composite_hue__"
-            df_to_use[composite_name] = df_to_use.apply(
-                lambda row: ", ".join(f"{col}={row[col]}" for col in hue),
-                axis=1
-            )
-            actual_hue = composite_name
-        elif isinstance(hue, str):
-            actual_hue = hue
-    
+
+    if ctx is None or ctx.df is not df or ctx.hue != hue:
+        ctx = AggContext(df, hue)
+    actual_hue = ctx.actual_hue
+
     for fq in filter_queries:
-        # Apply filter
-        subset = df_to_use
-        for col, val in fq.items():
-            subset = subset[subset[col] == val]
-        
+        # Apply filter (cached on the context)
+        subset = ctx.subset(fq)
+
         if subset.empty:
             continue
-        
+
         # Process x-axis
-        xnum = pd.to_numeric(subset[x], errors="coerce")
-        if xnum.notna().any():
-            xmins.append(float(xnum.min()))
-            xmaxs.append(float(xnum.max()))
-        
+        xnum = _numeric_view(subset[x])
+        if not np.isnan(xnum).all():
+            xmins.append(float(np.nanmin(xnum)))
+            xmaxs.append(float(np.nanmax(xnum)))
+
         # Process y-axis with SEM aggregation if needed
         if sem_column and sem_column in subset.columns:
             # Apply same aggregation logic as plotting
             if actual_hue and actual_hue in subset.columns:
                 # Group by hue first, then aggregate
-                for _, hue_sub in subset.groupby(actual_hue):
+                for _, hue_sub in ctx.groupby(fq, actual_hue):
                     if sem_precomputed:
                         y_vals = _compute_precomputed_sem_stats(hue_sub, x, y, sem_column)
                     else:
@@ -126,14 +306,14 @@ def shared_limits_with_sem(
         else:
             # No SEM: use aggregated means
             if actual_hue and actual_hue in subset.columns:
-                for _, hue_sub in subset.groupby(actual_hue):
-                    agg = hue_sub.groupby(x, as_index=False)[y].mean()
+                for _, hue_sub in ctx.groupby(fq, actual_hue):
+                    agg = hue_sub.groupby(x, as_index=False, observed=True)[y].mean(**_NUMBA_GROUPBY_KW)
                     ynum = pd.to_numeric(agg[y], errors="coerce")
                     if ynum.notna().any():
                         ymins.append(float(ynum.min()))
                         ymaxs.append(float(ynum.max()))
             else:
-                agg = subset.groupby(x, as_index=False)[y].mean()
+                agg = subset.groupby(x, as_index=False, observed=True)[y].mean(**_NUMBA_GROUPBY_KW)
                 ynum = pd.to_numeric(agg[y], errors="coerce")
                 if ynum.notna().any():
                     ymins.append(float(ynum.min()))
@@ -153,8 +333,8 @@ def _compute_sem_stats(
     Returns (lower_bounds, upper_bounds) where lower = mean - SEM
     and upper = mean + SEM for each x value.
     """
-    grouped = df.groupby([sem_column, x], as_index=False)[y].mean()
-    stats = grouped.groupby(x)[y].agg(['mean', 'sem']).reset_index()
+    grouped = df.groupby([sem_column, x], as_index=False, sort=False, observed=True)[y].mean(**_NUMBA_GROUPBY_KW)
+    stats = grouped.groupby(x, observed=True)[y].agg(['mean', 'sem']).reset_index()
     
     if stats.empty:
         return None
@@ -178,10 +358,7 @@ def _compute_precomputed_sem_stats(
     and upper = mean + SEM for each x value.
     """
     # Aggregate by x: mean of y and mean of sem
-    agg_df = df.groupby(x, as_index=False).agg({
-        y: 'mean',
-        sem_column: 'mean'
-    })
+    agg_df = df.groupby(x, as_index=False, observed=True)[[y, sem_column]].mean(**_NUMBA_GROUPBY_KW)
     
     if agg_df.empty:
         return None
@@ -1,13 +1,63 @@
 from __future__ import annotations
 
+import gzip
+import io
 import json
 import os
-from dataclasses import asdict
+import re
+import zipfile
+from dataclasses import fields
+
+import numpy as np
 from pathlib import Path
 from typing import Any
 
 from plot_organizer.models import ColumnSchema, DataSource, PlotSpec, PlotInstance, GridLayout
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    feather = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Fastest available JSON parser: orjson, then pandas' bundled ujson
+# (already a dependency), then stdlib
+if orjson is not None:
+    _jloads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson
+    try:
+        from pandas.io.json import ujson_loads as _jloads
+    except ImportError:
+        _jloads = json.loads
+
+# Error-marker columns stored in the Feather member of binary workspaces
+_MARKER_FIELDS = ("x", "y", "xerr", "yerr", "color", "label", "marker")
+
+# Above this many plots, save_workspace streams the document instead of
+# buffering one serialized byte-string for the whole payload
+_STREAM_THRESHOLD = 1000
+
+# Compiled once; load_workspace peeks this against the head of the raw
+# bytes to reject incompatible files before the full parse
+_VERSION_PEEK = re.compile(rb'"version"\s*:\s*"([^"]+)"')
+
+# Field name tuples computed once; a flat {k: getattr(o, k)} projection
+# over these skips dataclasses.asdict's recursive deepcopy-style walk
+_SCHEMA_KEYS = tuple(f.name for f in fields(ColumnSchema))
+_PLOT_KEYS = tuple(f.name for f in fields(PlotSpec))
+_INSTANCE_KEYS = tuple(f.name for f in fields(PlotInstance))
+
 
 def save_project(
     path: str,
@@ -17,35 +67,84 @@ def save_project(
     grid: GridLayout,
 ) -> None:
     """Legacy save function using model-based approach (not currently used by UI)."""
-    root = Path(path).resolve().parent
+    # Resolve the project root once; per-source paths are relativized with
+    # pure string arithmetic (resolve() stats the filesystem per call,
+    # which is slow on network mounts)
+    root_str = str(Path(path).resolve().parent)
+    prefix = root_str + os.sep
+    root_drive = os.path.splitdrive(root_str)[0]
 
     def make_rel(p: str) -> str:
+        # Sources under the project root — the common case — reduce to a
+        # string slice
+        if p.startswith(prefix):
+            return p[len(prefix):]
+        abs_p = os.path.abspath(p)
+        # relpath across Windows drives has no answer; keep absolute
+        if os.path.splitdrive(abs_p)[0] != root_drive:
+            return p
         try:
-            return str(Path(p).resolve().relative_to(root))
-        except Exception:
+            return os.path.relpath(abs_p, root_str)
+        except ValueError:
             return p
 
+    # With orjson, hand the model objects straight to its C serializer —
+    # dataclasses are encoded natively in field order, so no intermediate
+    # Python dicts are built for schemas, plots or instances. DataSource
+    # keeps its hand-written projection: it carries the loaded dataframe,
+    # which must not be serialized, and its path is relativized anyway.
+    if orjson is not None:
+        plots_payload: list[Any] = plots
+        instances_payload: list[Any] = instances
+
+        def schema_payload(schema):
+            return schema
+    else:
+        plots_payload = [{k: getattr(p, k) for k in _PLOT_KEYS} for p in plots]
+        instances_payload = [
+            {k: getattr(i, k) for k in _INSTANCE_KEYS} for i in instances
+        ]
+
+        def schema_payload(schema):
+            return [{k: getattr(s, k) for k in _SCHEMA_KEYS} for s in schema]
+
+    # Hoisted out of the payload comprehension so each pass over the
+    # sources does one job; the entry build below is then a plain zip
+    rel_paths = [make_rel(ds.path) for ds in data_sources]
+    schemas = [schema_payload(ds.schema) for ds in data_sources]
+
     payload: dict[str, Any] = {
         "version": 1,
         "data_sources": [
-            {
-                "id": ds.id,
-                "name": ds.name,
-                "path": make_rel(ds.path),
-                "schema": [asdict(s) for s in ds.schema],
-            }
-            for ds in data_sources
+            {"id": ds.id, "name": ds.name, "path": rel, "schema": schema}
+            for ds, rel, schema in zip(data_sources, rel_paths, schemas)
         ],
-        "plots": [asdict(p) for p in plots],
-        "instances": [asdict(i) for i in instances],
+        "plots": plots_payload,
+        "instances": instances_payload,
         "grid": {
             "rows": grid.rows,
             "cols": grid.cols,
-            "cells": {str(k): v for k, v in grid.cells.items()},
+            # Sparse encoding as [row, col, instance_id] triples: only
+            # occupied cells are written, no per-key string formatting,
+            # and the load side iterates directly instead of parsing keys
+            "cells": [
+                [r, c, grid.cells[r, c]]
+                for r, c in np.ndindex(grid.cells.shape)
+                if grid.cells[r, c] is not None
+            ],
         },
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    # orjson's C serializer is an order of magnitude faster than stdlib
+    # json for the many nested schema/instance dicts; output stays
+    # 2-space-indented either way
+    if orjson is not None:
+        data = orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+        Path(path).write_bytes(data)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
 
 
 def save_workspace(
@@ -54,39 +153,65 @@ def save_workspace(
     data_sources: dict[str, dict[str, Any]],
     grid_rows: int,
     grid_cols: int,
+    binary: bool = False,
 ) -> None:
     """Save workspace state from UI components to JSON file.
-    
+
     Args:
         path: Output file path (.ppo)
         grid_layout: List of plot descriptors from GridBoard.serialize_layout()
         data_sources: Dict of datasource info {id: {name, path, schema}}
         grid_rows: Actual number of rows in the grid
         grid_cols: Actual number of columns in the grid
+        binary: Write a zip container holding a small JSON header plus the
+            error markers as a columnar Feather table instead of one JSON
+            document. Several times faster and smaller for marker-heavy
+            workspaces; load_workspace detects the format automatically.
     """
-    root = Path(path).resolve().parent
+    root_str = str(Path(path).resolve().parent)
+    prefix = root_str + os.sep
+    root_drive = os.path.splitdrive(root_str)[0]
 
     def make_rel(p: str) -> str:
         """Convert absolute path to relative path from project file."""
+        # Sources under the project root — the common case — reduce to a
+        # string slice
+        if p.startswith(prefix):
+            return p[len(prefix):]
+        # abspath is string-only; no stat per datasource
+        abs_p = os.path.abspath(p)
+        # relpath across Windows drives has no answer; keep absolute
+        if os.path.splitdrive(abs_p)[0] != root_drive:
+            return p
         try:
-            abs_path = str(Path(p).resolve())
-            rel_path = os.path.relpath(abs_path, root)
-            return rel_path
-        except (ValueError, Exception):
-            # If relpath fails (e.g., different drive on Windows), keep absolute
-            return str(p)
+            return os.path.relpath(abs_p, root_str)
+        except ValueError:
+            return p
 
     # Use the actual grid dimensions passed in
     rows, cols = grid_rows, grid_cols
 
-    # Convert data sources to list format with relative paths
+    # Convert data sources to list format with relative paths. Schemas are
+    # interned into one shared table: sources loaded from the same file
+    # family repeat identical column lists, and writing each copy inflates
+    # the document and the encode time proportionally. Each source stores
+    # an index into "schemas"; load_workspace expands it back.
+    schemas: list[Any] = []
+
+    def schema_ref(schema: Any) -> int:
+        for i, seen in enumerate(schemas):
+            if seen is schema or seen == schema:
+                return i
+        schemas.append(schema)
+        return len(schemas) - 1
+
     ds_list = []
     for ds_id, ds_info in data_sources.items():
         ds_dict = {
             "id": ds_id,
             "name": ds_info["name"],
             "path": make_rel(ds_info["path"]),
-            "schema": ds_info.get("schema", []),
+            "schema_ref": schema_ref(ds_info.get("schema", [])),
         }
         ds_list.append(ds_dict)
 
@@ -96,12 +221,137 @@ def save_workspace(
             "rows": rows,
             "cols": cols,
         },
+        "schemas": schemas,
         "data_sources": ds_list,
         "plots": grid_layout,
     }
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    if binary and feather is not None:
+        _save_workspace_binary(path, payload)
+        return
+
+    if orjson is not None and len(grid_layout) > _STREAM_THRESHOLD:
+        # Emit the plots array element by element: peak memory stays at
+        # one encoded entry rather than the whole document. Output is
+        # compact, which orjson parses back just as fast on load.
+        if path.endswith(".gz"):
+            with gzip.open(path, "wb", compresslevel=3) as f:
+                _write_workspace_streaming(f, payload)
+        elif path.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError("zstandard is required to write .zst workspaces")
+            with open(path, "wb") as raw:
+                with zstandard.ZstdCompressor(level=3).stream_writer(raw) as f:
+                    _write_workspace_streaming(f, payload)
+        else:
+            with open(path, "wb") as f:
+                _write_workspace_streaming(f, payload)
+        return
+
+    # Same serializer split as save_project: orjson's C encoder when
+    # available, stdlib otherwise
+    if orjson is not None:
+        data = orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+
+    # Transparent compression by extension: for marker-heavy workspaces
+    # the write is bandwidth-bound and indented JSON compresses 5-10x
+    if path.endswith(".gz"):
+        with gzip.open(path, "wb", compresslevel=3) as f:
+            f.write(data)
+    elif path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("zstandard is required to write .zst workspaces")
+        Path(path).write_bytes(zstandard.ZstdCompressor(level=3).compress(data))
+    else:
+        Path(path).write_bytes(data)
+
+
+def _write_workspace_streaming(f, payload: dict[str, Any]) -> None:
+    """Write workspace JSON with the plots array emitted incrementally.
+
+    The header (everything but "plots") is encoded in one small orjson
+    call; each plot entry is then encoded and written on its own, so the
+    full document is never held in memory as one byte-string.
+    """
+    head = dict(payload)
+    head.pop("plots")
+    head_bytes = orjson.dumps(head, option=orjson.OPT_SERIALIZE_NUMPY)
+    f.write(head_bytes[:-1])  # drop the closing brace; plots go inside
+    f.write(b',"plots":[')
+    for i, plot in enumerate(payload["plots"]):
+        if i:
+            f.write(b",")
+        f.write(orjson.dumps(plot, option=orjson.OPT_SERIALIZE_NUMPY))
+    f.write(b"]}")
+
+
+def _save_workspace_binary(path: str, payload: dict[str, Any]) -> None:
+    """Write a workspace as a zip of JSON header + Feather marker table.
+
+    The error markers — the bulk tabular part of a large workspace — are
+    flattened across plots into one columnar table; everything else stays
+    a small JSON header, so the text encoder never sees the big lists.
+    """
+    plots = payload["plots"]
+    rows: list[dict[str, Any]] = []
+    for i, plot in enumerate(plots):
+        for marker in plot.get("error_markers") or []:
+            row: dict[str, Any] = {"plot_index": i}
+            for f in _MARKER_FIELDS:
+                row[f] = marker.get(f)
+            rows.append(row)
+
+    header = dict(payload)
+    header["plots"] = [
+        {k: v for k, v in plot.items() if k != "error_markers"} for plot in plots
+    ]
+
+    if orjson is not None:
+        header_bytes = orjson.dumps(header, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        header_bytes = json.dumps(header).encode("utf-8")
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("workspace.json", header_bytes)
+        if rows:
+            buf = io.BytesIO()
+            table = pa.Table.from_pylist(rows)
+            try:
+                feather.write_feather(table, buf, compression="zstd")
+            except Exception:  # pyarrow built without zstd
+                buf = io.BytesIO()
+                feather.write_feather(table, buf)
+            zf.writestr("error_markers.feather", buf.getvalue())
+
+
+def _load_workspace_binary(path: str) -> dict[str, Any]:
+    """Read a zip-container workspace written by _save_workspace_binary."""
+    with zipfile.ZipFile(path) as zf:
+        raw = zf.read("workspace.json")
+        payload = _jloads(raw)
+        names = set(zf.namelist())
+        if "error_markers.feather" in names and feather is not None:
+            table = feather.read_table(io.BytesIO(zf.read("error_markers.feather")))
+            markers = table.to_pylist()
+        else:
+            markers = []
+
+    plots = payload.get("plots", [])
+    for plot in plots:
+        plot.setdefault("error_markers", [])
+    for row in markers:
+        idx = row.pop("plot_index")
+        # The Feather table materializes every marker column, so fields the
+        # marker never had come back as None; drop them to restore key
+        # absence, which the renderer's .get(...) defaults rely on
+        plots[idx]["error_markers"].append(
+            {k: v for k, v in row.items() if v is not None}
+        )
+    return payload
 
 
 def load_workspace(path: str) -> dict[str, Any]:
@@ -119,30 +369,54 @@ def load_workspace(path: str) -> dict[str, Any]:
         json.JSONDecodeError: If file is not valid JSON
         ValueError: If version is incompatible
     """
-    root = Path(path).resolve().parent
+    root_str = str(Path(path).resolve().parent)
 
-    with open(path, "r", encoding="utf-8") as f:
-        payload = json.load(f)
+    if zipfile.is_zipfile(path):
+        # Binary container written with save_workspace(binary=True)
+        payload = _load_workspace_binary(path)
+    else:
+        # Read the whole file once and decode with orjson's C parser when
+        # available; headless exports parse the workspace before any plotting.
+        raw = Path(path).read_bytes()
+        if path.endswith(".gz"):
+            raw = gzip.decompress(raw)
+        elif path.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError("zstandard is required to read .zst workspaces")
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        # Version lives in the first few bytes of every file we write;
+        # peeking for it rejects incompatible files without paying for a
+        # full parse. No match (hand-edited key order) just falls through.
+        m = _VERSION_PEEK.search(raw[:256])
+        if m and not m.group(1).startswith(b"0."):
+            raise ValueError(
+                f"Incompatible version: {m.group(1).decode()}. Expected 0.x"
+            )
+        payload = _jloads(raw)
 
-    # Version check
+    # Version check (exact type test; version is never a str subclass)
     version = payload.get("version", "0.0.0")
-    if not isinstance(version, str):
+    if type(version) is not str:
         raise ValueError(f"Invalid version format: {version}")
-    
+
     # For now, accept any 0.x version
     if not version.startswith("0."):
         raise ValueError(f"Incompatible version: {version}. Expected 0.x")
 
-    def make_abs(p: str) -> str:
-        """Convert relative path to absolute path."""
-        path_obj = Path(p)
-        if path_obj.is_absolute():
-            return str(path_obj)
-        return str((root / path_obj).resolve())
+    # Expand interned schemas back onto each datasource; files written
+    # before the shared "schemas" table carry per-source "schema" already
+    schemas = payload.pop("schemas", None)
+    for ds in payload.get("data_sources", []):
+        if "schema_ref" in ds:
+            ds["schema"] = schemas[ds.pop("schema_ref")]
 
-    # Convert relative paths to absolute
+    # Convert relative paths to absolute. String-only join/normalization;
+    # the root was resolved once above and resolving per datasource would
+    # stat the filesystem each time. Already-absolute paths pass through.
     for ds in payload.get("data_sources", []):
-        ds["path"] = make_abs(ds["path"])
+        p = ds["path"]
+        if not os.path.isabs(p):
+            ds["path"] = os.path.normpath(os.path.join(root_str, p))
 
     return payload
 
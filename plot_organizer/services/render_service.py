@@ -2,9 +2,22 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+# Loaded on first render: importing matplotlib pulls in tens of MB and
+# may scan the font cache, which CLI/API workflows that never render
+# should not pay at import time.
+_plt = None
+
+
+def _pyplot():
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
 
 def render_line_plot(
     df: pd.DataFrame,
@@ -15,18 +28,81 @@ def render_line_plot(
     style_overrides: Optional[dict[str, Any]] = None,
     shared_xlim: Optional[tuple[float, float]] = None,
     shared_ylim: Optional[tuple[float, float]] = None,
+    figsize: tuple[float, float] = (4, 3),
+    ax=None,
+    aggregate: bool = False,
 ):
-    fig, ax = plt.subplots(figsize=(4, 3), constrained_layout=True)
+    plt = _pyplot()
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
+    if ax is not None:
+        # Batch callers pass the same axis back in and pay only a clear,
+        # not the full axes/spine/tick construction of plt.subplots
+        ax.clear()
+        fig = ax.figure
+    else:
+        # Taking the target size up front avoids a full relayout pass that
+        # a later set_size_inches() before savefig would trigger.
+        fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
     style = {"linewidth": 1.5}
     if style_overrides:
         style.update(style_overrides)
 
+    if aggregate:
+        # Collapse repeated x values (e.g. one row per seed) to their mean
+        # before plotting: the renderer then draws one vertex per unique x
+        # instead of a zig-zag through every raw row. Grouping sorts by
+        # key, so x comes out draw-ready within each hue group.
+        keys = [hue, x] if hue else [x]
+        df = df.groupby(keys, as_index=False, observed=True)[y].mean()
+
+    # Extract the raw buffers once; handing Series to ax.plot goes through
+    # __array__ conversion and unit/label inspection per call
+    x_arr = df[x].to_numpy(copy=False)
+    y_arr = df[y].to_numpy(copy=False)
+
     if hue:
-        for key, sub in df.groupby(hue):
-            ax.plot(sub[x], sub[y], label=str(key), **style)
-        ax.legend(loc="best")
+        # One LineCollection instead of one Line2D per hue category:
+        # sort by categorical codes, split into contiguous segments, and
+        # issue a single add_collection call. Cuts per-group artist
+        # construction to a single draw-path object.
+        cat = pd.Categorical(df[hue])
+        valid = cat.codes >= 0  # groupby drops NaN hue keys; match that
+        order = np.argsort(cat.codes[valid], kind="stable")
+        codes = cat.codes[valid][order]
+        x_arr = x_arr[valid][order]
+        y_arr = y_arr[valid][order]
+
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        segments = [
+            np.column_stack([xs, ys])
+            for xs, ys in zip(np.split(x_arr, bounds), np.split(y_arr, bounds))
+        ]
+        labels = [
+            str(cat.categories[code])
+            for code in codes[np.concatenate(([0], bounds))]
+        ] if len(codes) else []
+
+        prop_cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+        colors = [prop_cycle[i % len(prop_cycle)] for i in range(len(segments))]
+        lc = LineCollection(
+            segments,
+            colors=colors,
+            linewidths=style.get("linewidth", 1.5),
+            linestyles=style.get("linestyle", "solid"),
+        )
+        ax.add_collection(lc)
+        ax.autoscale_view()
+
+        # Legend via proxy artists; the collection itself is one artist
+        proxies = [
+            Line2D([0], [0], color=color, linewidth=style.get("linewidth", 1.5))
+            for color in colors
+        ]
+        ax.legend(proxies, labels, loc="best")
     else:
-        ax.plot(df[x], df[y], **style)
+        ax.plot(x_arr, y_arr, **style)
 
     if title:
         ax.set_title(title)
@@ -39,5 +115,3 @@ def render_line_plot(
     ax.set_xlabel(x)
     ax.set_ylabel(y)
     return fig, ax
-
-
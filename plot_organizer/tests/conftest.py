@@ -0,0 +1,117 @@
+"""Shared fixtures for the test suite."""
+from __future__ import annotations
+
+import matplotlib
+
+# Route pyplot-created figures through the pure-memory Agg backend
+# before anything imports pyplot: no test inspects rendered pixels, so
+# there is no reason to spin up Qt figure managers for them. PlotTile
+# keeps its QtAgg canvas — it is a QWidget living in a layout, and its
+# rasterization already goes through Agg underneath.
+matplotlib.use("Agg", force=True)
+
+# Assertions read ax.lines / ax.legend_ directly; make sure no implicit
+# relayout pass sneaks in between set_plot and the inspection
+matplotlib.rcParams["figure.autolayout"] = False
+
+# Belt and braces: interactive mode would re-draw on every artist
+# change; it defaults off, but pin it in case a user rc turns it on
+matplotlib.rcParams["interactive"] = False
+
+import os
+
+# No test inspects rendered pixels, so PlotTile skips its canvas draw
+# after set_plot/clear_plot; a test needing a real draw can delenv this
+os.environ["PLOT_ORGANIZER_NO_DRAW"] = "1"
+
+import functools
+
+import numpy as np
+import pandas as pd
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "gui: test drives Qt widgets / Matplotlib canvases"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_df(items: tuple) -> pd.DataFrame:
+    return pd.DataFrame({name: list(values) for name, values in items})
+
+
+def _make_df(**cols) -> pd.DataFrame:
+    """Build (and memoize) a small test frame from keyword columns.
+
+    The same column spec returns the same DataFrame instance, so dtype
+    inference and BlockManager assembly happen once per distinct frame
+    instead of once per test. Callers must not mutate the result.
+    """
+    return _cached_df(tuple((name, tuple(values)) for name, values in cols.items()))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """One QApplication for the whole session.
+
+    Qt allows a single application object per process; creating it once
+    here removes the import-time and per-test construction the modules
+    used to do individually.
+    """
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture(scope="session")
+def _tile_pool(qapp):
+    """Session-lived PlotTiles handed out by tile_factory."""
+    return []
+
+
+@pytest.fixture
+def tile_factory(_tile_pool):
+    """Return a callable yielding recycled, cleared PlotTiles.
+
+    Building a PlotTile means a Matplotlib figure, an Agg canvas and Qt
+    widgets; recycling instances across tests replaces all of that with
+    a clear_plot() per handout.
+    """
+    from plot_organizer.ui.grid_board import PlotTile
+
+    used = 0
+
+    def make() -> PlotTile:
+        nonlocal used
+        if used == len(_tile_pool):
+            _tile_pool.append(PlotTile())
+        t = _tile_pool[used]
+        used += 1
+        t.clear_plot()
+        return t
+
+    return make
+
+
+@pytest.fixture
+def tile(tile_factory):
+    """A single recycled PlotTile, reset to its empty state."""
+    return tile_factory()
+
+
+@pytest.fixture(scope="session")
+def make_df():
+    """The memoized frame builder, exposed to tests as a fixture."""
+    return _make_df
+
+
+@pytest.fixture(scope="session")
+def too_many_combos_df():
+    """Frame whose group columns exceed the expand_groups combination cap."""
+    return pd.DataFrame({
+        "cat1": np.tile(np.arange(20), 5),
+        "cat2": np.arange(100) % 10,
+        "val": np.arange(100),
+    })
@@ -10,6 +10,8 @@ from __future__ import annotations
 import pandas as pd
 import pytest
 
+pytestmark = pytest.mark.gui
+
 
 def test_marker_dialog_doesnt_duplicate_axes():
     """Test that opening marker dialog multiple times doesn't create duplicate axes."""
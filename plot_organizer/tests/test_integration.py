@@ -1,50 +1,73 @@
 from __future__ import annotations
 
+import time
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from plot_organizer.services import expand_groups, shared_limits
 
 
-def test_expand_groups_no_groups():
-    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
-    combos = expand_groups(df, [])
-    assert len(combos) == 1
-    assert combos[0] == {}
+@pytest.fixture(scope="module")
+def groups_df():
+    """One frame covering the no/single/two-column group cases."""
+    return pd.DataFrame({
+        "cat1": ["A", "A", "B", "B"],
+        "cat2": ["X", "Y", "X", "Y"],
+        "val": [1, 2, 3, 4],
+    })
 
 
-def test_expand_groups_single_column():
-    df = pd.DataFrame({"cat": ["A", "B", "A", "C"], "val": [1, 2, 3, 4]})
-    combos = expand_groups(df, ["cat"])
-    assert len(combos) == 3
-    assert {"cat": "A"} in combos
-    assert {"cat": "B"} in combos
-    assert {"cat": "C"} in combos
+@pytest.mark.parametrize(
+    "groups,expected",
+    [
+        ([], [{}]),
+        (
+            ["cat1"],
+            [{"cat1": "A"}, {"cat1": "B"}],
+        ),
+        (
+            ["cat1", "cat2"],
+            [
+                {"cat1": "A", "cat2": "X"},
+                {"cat1": "A", "cat2": "Y"},
+                {"cat1": "B", "cat2": "X"},
+                {"cat1": "B", "cat2": "Y"},
+            ],
+        ),
+    ],
+    ids=["no_groups", "single_column", "two_columns"],
+)
+def test_expand_groups(groups_df, groups, expected):
+    combos = expand_groups(groups_df, groups)
+    assert len(combos) == len(expected)
+    for combo in expected:
+        assert combo in combos
 
 
-def test_expand_groups_two_columns():
-    df = pd.DataFrame({
-        "cat1": ["A", "A", "B", "B"],
-        "cat2": ["X", "Y", "X", "Y"],
-        "val": [1, 2, 3, 4]
-    })
-    combos = expand_groups(df, ["cat1", "cat2"])
-    assert len(combos) == 4
-    assert {"cat1": "A", "cat2": "X"} in combos
-    assert {"cat1": "A", "cat2": "Y"} in combos
-    assert {"cat1": "B", "cat2": "X"} in combos
-    assert {"cat1": "B", "cat2": "Y"} in combos
-
-
-def test_expand_groups_exceeds_limit():
-    # Create a dataframe that would generate > 100 combinations
-    df = pd.DataFrame({
-        "cat1": list(range(20)) * 5,
-        "cat2": [i % 10 for i in range(100)],
-        "val": range(100)
-    })
+def test_expand_groups_exceeds_limit(too_many_combos_df):
+    # 20 x 10 categories would generate > 100 combinations
     with pytest.raises(ValueError, match="Too many combinations"):
-        expand_groups(df, ["cat1", "cat2"])
+        expand_groups(too_many_combos_df, ["cat1", "cat2"])
+
+
+def test_expand_groups_large_frame_fast():
+    """Lock expand_groups to the per-column-uniques path.
+
+    With 200k rows over four group columns, anything that iterates rows
+    or cross-merges blows well past the budget; building the product
+    from column uniques stays comfortably inside it.
+    """
+    rng = np.random.default_rng(0)
+    n = 200_000
+    df = pd.DataFrame({f"c{i}": rng.integers(0, 3, n) for i in range(4)})
+    cols = [f"c{i}" for i in range(4)]
+    t0 = time.perf_counter()
+    combos = expand_groups(df, cols)
+    elapsed = time.perf_counter() - t0
+    assert len(combos) == 3 ** 4
+    assert elapsed < 1.0
 
 
 def test_shared_limits_basic():
@@ -57,6 +80,24 @@ def test_shared_limits_basic():
     assert ymax == 30.0
 
 
+def test_shared_limits_large():
+    """Lock shared_limits to array-level scans.
+
+    Two 2M-row subsets: per-element pandas min/max bookkeeping would
+    miss the budget by a wide margin, while the concatenated
+    nanmin/nanmax pass stays well under it.
+    """
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": rng.standard_normal(2_000_000),
+                       "y": rng.standard_normal(2_000_000)})
+    t0 = time.perf_counter()
+    (xmin, xmax), (ymin, ymax) = shared_limits([df, df], "x", "y")
+    elapsed = time.perf_counter() - t0
+    assert xmin < xmax
+    assert ymin < ymax
+    assert elapsed < 0.5
+
+
 def test_shared_limits_with_empty():
     df1 = pd.DataFrame({"x": [1, 2, 3], "y": [10, 20, 30]})
     df_empty = pd.DataFrame({"x": [], "y": []})
@@ -65,4 +106,3 @@ def test_shared_limits_with_empty():
     assert xmax == 3.0
     assert ymin == 10.0
     assert ymax == 30.0
-
@@ -1,39 +1,29 @@
 """Tests for multi-column hue functionality."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
-from PySide6.QtWidgets import QApplication
 
-from plot_organizer.ui.grid_board import PlotTile
 from plot_organizer.services.plot_service import shared_limits_with_sem
 
+pytestmark = pytest.mark.gui
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
 
-
-def test_multi_column_hue_basic(qapp):
+def test_multi_column_hue_basic(tile):
     """Test that multi-column hue creates composite labels."""
     df = pd.DataFrame({
-        'x': [1, 1, 2, 2, 3, 3] * 4,
-        'y': [10, 12, 15, 17, 20, 22] * 4,
-        'species': ['A', 'A', 'A', 'A', 'A', 'A', 
-                    'B', 'B', 'B', 'B', 'B', 'B'] * 2,
-        'gender': ['male', 'female'] * 12,
+        'x': np.tile([1, 1, 2, 2, 3, 3], 4),
+        'y': np.tile([10, 12, 15, 17, 20, 22], 4),
+        'species': np.tile(np.repeat(['A', 'B'], 6), 2),
+        'gender': np.tile(['male', 'female'], 12),
     })
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue=['species', 'gender'])
     
     # Get the axes and check that we have a legend
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     assert legend is not None, "Legend should be present with multi-column hue"
     
@@ -55,7 +45,7 @@ def test_multi_column_hue_basic(qapp):
     assert sorted(labels) == sorted(expected_labels), f"Labels don't match. Got: {labels}"
 
 
-def test_single_column_hue_backward_compat(qapp):
+def test_single_column_hue_backward_compat(tile):
     """Test that single string hue still works (backward compatibility)."""
     df = pd.DataFrame({
         'x': [1, 2, 3, 1, 2, 3],
@@ -63,11 +53,10 @@ def test_single_column_hue_backward_compat(qapp):
         'group': ['A', 'A', 'A', 'B', 'B', 'B'],
     })
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue='group')
     
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     assert legend is not None
     labels = [text.get_text() for text in legend.get_texts()]
@@ -77,56 +66,52 @@ def test_single_column_hue_backward_compat(qapp):
     assert set(labels) == {'A', 'B'}
 
 
-def test_no_hue(qapp):
+def test_no_hue(tile):
     """Test that no hue works correctly."""
     df = pd.DataFrame({
         'x': [1, 2, 3],
         'y': [10, 15, 20],
     })
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue=None)
     
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     # Should have no legend
     assert legend is None
 
 
-def test_empty_hue_list(qapp):
+def test_empty_hue_list(tile):
     """Test that empty hue list works like no hue."""
     df = pd.DataFrame({
         'x': [1, 2, 3],
         'y': [10, 15, 20],
     })
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue=[])
     
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     # Should have no legend
     assert legend is None
 
 
-def test_multi_column_hue_with_sem(qapp):
+def test_multi_column_hue_with_sem(tile):
     """Test multi-column hue with SEM column."""
     df = pd.DataFrame({
-        'x': [1, 1, 1, 2, 2, 2] * 4,
-        'y': [10, 11, 12, 20, 21, 22] * 4,
-        'subject': [1, 2, 3, 1, 2, 3] * 4,
-        'condition': ['A', 'A', 'A', 'A', 'A', 'A',
-                      'B', 'B', 'B', 'B', 'B', 'B'] * 2,
-        'treatment': ['drug', 'placebo'] * 12,
+        'x': np.tile([1, 1, 1, 2, 2, 2], 4),
+        'y': np.tile([10, 11, 12, 20, 21, 22], 4),
+        'subject': np.tile([1, 2, 3], 8),
+        'condition': np.tile(np.repeat(['A', 'B'], 6), 2),
+        'treatment': np.tile(['drug', 'placebo'], 12),
     })
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue=['condition', 'treatment'], sem_column='subject')
     
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     assert legend is not None
     labels = [text.get_text() for text in legend.get_texts()]
@@ -138,11 +123,11 @@ def test_multi_column_hue_with_sem(qapp):
 def test_shared_limits_with_multi_column_hue():
     """Test that shared_limits_with_sem works with multi-column hue."""
     df = pd.DataFrame({
-        'x': [1, 2, 3] * 8,
-        'y': [10, 20, 30] * 8,
-        'group': ['G1'] * 12 + ['G2'] * 12,
-        'species': ['A', 'A', 'A', 'B', 'B', 'B'] * 4,
-        'gender': ['male', 'female'] * 12,
+        'x': np.tile([1, 2, 3], 8),
+        'y': np.tile([10, 20, 30], 8),
+        'group': np.repeat(['G1', 'G2'], 12),
+        'species': np.tile(np.repeat(['A', 'B'], 3), 4),
+        'gender': np.tile(['male', 'female'], 12),
     })
     
     filter_queries = [{'group': 'G1'}, {'group': 'G2'}]
@@ -157,21 +142,20 @@ def test_shared_limits_with_multi_column_hue():
     assert ylim[0] <= 10 and ylim[1] >= 30
 
 
-def test_multi_column_hue_three_columns(qapp):
+def test_multi_column_hue_three_columns(tile):
     """Test multi-column hue with three columns."""
     df = pd.DataFrame({
-        'x': [1, 2, 3] * 8,
-        'y': [10, 20, 30] * 8,
-        'col1': ['A', 'A', 'A', 'A', 'B', 'B', 'B', 'B'] * 3,
-        'col2': ['X', 'X', 'Y', 'Y'] * 6,
-        'col3': ['P', 'Q'] * 12,
+        'x': np.tile([1, 2, 3], 8),
+        'y': np.tile([10, 20, 30], 8),
+        'col1': np.tile(np.repeat(['A', 'B'], 4), 3),
+        'col2': np.tile(np.repeat(['X', 'Y'], 2), 6),
+        'col3': np.tile(['P', 'Q'], 12),
     })
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue=['col1', 'col2', 'col3'])
     
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     assert legend is not None
     labels = [text.get_text() for text in legend.get_texts()]
@@ -188,7 +172,7 @@ def test_multi_column_hue_three_columns(qapp):
         assert label.count(',') == 2   # Two commas separating them
 
 
-def test_multi_column_hue_preserves_original(qapp):
+def test_multi_column_hue_preserves_original(tile):
     """Test that multi-column hue doesn't modify the original dataframe."""
     df = pd.DataFrame({
         'x': [1, 2, 3],
@@ -199,7 +183,6 @@ def test_multi_column_hue_preserves_original(qapp):
     
     original_columns = df.columns.tolist()
     
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', hue=['species', 'gender'])
     
     # Original dataframe should be unchanged
@@ -207,7 +190,7 @@ def test_multi_column_hue_preserves_original(qapp):
     assert '__composite_hue__' not in df.columns
 
 
-def test_multi_column_hue_with_filter(qapp):
+def test_multi_column_hue_with_filter(tile):
     """Test multi-column hue works with filter_query."""
     df = pd.DataFrame({
         'x': [1, 2, 3] * 4,
@@ -217,7 +200,6 @@ def test_multi_column_hue_with_filter(qapp):
         'gender': ['male', 'female'] * 6,
     })
     
-    tile = PlotTile()
     tile.set_plot(
         df, x='x', y='y', 
         hue=['species', 'gender'],
@@ -225,7 +207,7 @@ def test_multi_column_hue_with_filter(qapp):
     )
     
     ax = tile.figure.axes[0]
-    legend = ax.get_legend()
+    legend = ax.legend_
     
     assert legend is not None
     labels = [text.get_text() for text in legend.get_texts()]
@@ -1,73 +1,49 @@
 """Tests for plot style (line, marker, both) feature."""
 from __future__ import annotations
 
-import pandas as pd
 import pytest
-import sys
-from PySide6.QtWidgets import QApplication
 
-# Ensure QApplication exists for Qt widgets
-if not QApplication.instance():
-    app = QApplication(sys.argv)
+pytestmark = pytest.mark.gui
 
-from plot_organizer.ui.grid_board import PlotTile
 
-
-def test_default_style_line_only():
+def test_default_style_line_only(tile, make_df):
     """Test that default style is line only."""
-    tile = PlotTile()
-    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
-    
-    tile.set_plot(df=df, x='x', y='y')
-    
-    assert tile._style_line is True
-    assert tile._style_marker is False
+    df = make_df(x=[1, 2, 3], y=[4, 5, 6])
 
+    tile.set_plot(df=df, x='x', y='y')
 
-def test_style_line_only():
-    """Test plotting with line only."""
-    tile = PlotTile()
-    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
-    
-    tile.set_plot(df=df, x='x', y='y', style_line=True, style_marker=False)
-    
     assert tile._style_line is True
     assert tile._style_marker is False
-    assert tile._get_plot_format() == '-'
 
 
-def test_style_marker_only():
-    """Test plotting with markers only."""
-    tile = PlotTile()
-    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
-    
-    tile.set_plot(df=df, x='x', y='y', style_line=False, style_marker=True)
-    
-    assert tile._style_line is False
-    assert tile._style_marker is True
-    assert tile._get_plot_format() == 'o'
+@pytest.mark.parametrize(
+    "style_line,style_marker,fmt",
+    [
+        (True, False, '-'),
+        (False, True, 'o'),
+        (True, True, '-o'),
+        (False, False, '-'),  # neither falls back to a line
+    ],
+    ids=["line", "marker", "line+marker", "neither"],
+)
+def test_style_format(tile, make_df, style_line, style_marker, fmt):
+    """Test that style flags map to the expected plot format string."""
+    df = make_df(x=[1, 2, 3], y=[4, 5, 6])
 
+    tile.set_plot(df=df, x='x', y='y', style_line=style_line, style_marker=style_marker)
 
-def test_style_line_and_marker():
-    """Test plotting with both line and markers."""
-    tile = PlotTile()
-    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
-    
-    tile.set_plot(df=df, x='x', y='y', style_line=True, style_marker=True)
-    
-    assert tile._style_line is True
-    assert tile._style_marker is True
-    assert tile._get_plot_format() == '-o'
+    assert tile._style_line is style_line
+    assert tile._style_marker is style_marker
+    assert tile._get_plot_format() == fmt
 
 
-def test_style_with_hue():
+def test_style_with_hue(tile, make_df):
     """Test that style settings work with hue."""
-    tile = PlotTile()
-    df = pd.DataFrame({
-        'x': [1, 2, 3, 1, 2, 3],
-        'y': [4, 5, 6, 7, 8, 9],
-        'hue': ['A', 'A', 'A', 'B', 'B', 'B']
-    })
+    df = make_df(
+        x=[1, 2, 3, 1, 2, 3],
+        y=[4, 5, 6, 7, 8, 9],
+        hue=['A', 'A', 'A', 'B', 'B', 'B'],
+    )
     
     tile.set_plot(df=df, x='x', y='y', hue='hue', style_line=True, style_marker=True)
     
@@ -78,14 +54,13 @@ def test_style_with_hue():
     assert len(ax.lines) == 2
 
 
-def test_style_with_sem():
+def test_style_with_sem(tile, make_df):
     """Test that style settings work with SEM."""
-    tile = PlotTile()
-    df = pd.DataFrame({
-        'x': [1, 2, 3, 1, 2, 3],
-        'y': [4, 5, 6, 4.5, 5.5, 6.5],
-        'sem_col': ['A', 'A', 'A', 'B', 'B', 'B']
-    })
+    df = make_df(
+        x=[1, 2, 3, 1, 2, 3],
+        y=[4, 5, 6, 4.5, 5.5, 6.5],
+        sem_col=['A', 'A', 'A', 'B', 'B', 'B'],
+    )
     
     tile.set_plot(
         df=df,
@@ -103,10 +78,9 @@ def test_style_with_sem():
     assert len(ax.lines) > 0
 
 
-def test_clear_plot_resets_style():
+def test_clear_plot_resets_style(tile, make_df):
     """Test that clearing a plot resets style to defaults."""
-    tile = PlotTile()
-    df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
+    df = make_df(x=[1, 2, 3], y=[4, 5, 6])
     
     tile.set_plot(df=df, x='x', y='y', style_line=False, style_marker=True)
     assert tile._style_line is False
@@ -118,9 +92,8 @@ def test_clear_plot_resets_style():
     assert tile._style_marker is False
 
 
-def test_style_format_string():
+def test_style_format_string(tile):
     """Test the _get_plot_format helper method."""
-    tile = PlotTile()
     
     # Line only
     tile._style_line = True
@@ -143,14 +116,9 @@ def test_style_format_string():
     assert tile._get_plot_format() == '-'
 
 
-def test_style_with_precomputed_sem():
+def test_style_with_precomputed_sem(tile, make_df):
     """Test that style settings work with pre-computed SEM."""
-    tile = PlotTile()
-    df = pd.DataFrame({
-        'x': [1, 2, 3],
-        'y': [4, 5, 6],
-        'sem': [0.1, 0.2, 0.15]
-    })
+    df = make_df(x=[1, 2, 3], y=[4, 5, 6], sem=[0.1, 0.2, 0.15])
     
     tile.set_plot(
         df=df,
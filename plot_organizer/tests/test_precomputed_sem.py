@@ -1,53 +1,90 @@
 """Tests for pre-computed SEM (Standard Error of the Mean) functionality."""
 
-import pandas as pd
 import numpy as np
-from PySide6.QtWidgets import QApplication
-from plot_organizer.ui.grid_board import PlotTile
+import pytest
 from plot_organizer.services.plot_service import shared_limits_with_sem
 
+pytestmark = pytest.mark.gui
 
-def test_precomputed_sem_single_row_per_x():
-    """Test pre-computed SEM with one row per x-value (ideal case)."""
-    data = {
-        'x': [1, 2, 3],
-        'y': [10, 20, 30],
-        'sem': [1.0, 2.0, 3.0]
-    }
-    df = pd.DataFrame(data)
-    
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
-    tile.set_plot(df, x='x', y='y', sem_column='sem', sem_precomputed=True)
-    
-    # Verify pre-computed flag is set
-    assert tile._sem_precomputed == True
-    assert tile._sem_column == 'sem'
-    
-    # Verify plot was created
+
+def _assert_plot_built(tile):
+    """Minimal shared assertion: set_plot produced axes."""
     assert len(tile.figure.axes) > 0
+
+
+def _check_sem_band(tile):
+    """Pre-computed mode drew a line plus a filled SEM band."""
+    _assert_plot_built(tile)
+    assert tile._sem_precomputed == True
     ax = tile.figure.axes[0]
-    
-    # Should have a line
-    lines = ax.get_lines()
-    assert len(lines) >= 1
-    
-    # Should have filled region for SEM
-    collections = ax.collections
-    assert len(collections) > 0
+    assert len(ax.lines) >= 1
+    assert len(ax.collections) > 0
 
 
-def test_precomputed_sem_duplicate_x_values():
+def _check_hue_legend(tile):
+    """One line and band per hue value, with a legend."""
+    _assert_plot_built(tile)
+    ax = tile.figure.axes[0]
+    assert len(ax.lines) == 2
+    assert ax.legend_ is not None
+    assert len(ax.collections) >= 2
+
+
+def _check_computed_default(tile):
+    """Omitting sem_precomputed falls back to computed mode."""
+    _assert_plot_built(tile)
+    assert tile._sem_precomputed == False
+
+
+@pytest.mark.parametrize(
+    "data,kwargs,check",
+    [
+        (
+            {'x': [1, 2, 3], 'y': [10, 20, 30], 'sem': [1.0, 2.0, 3.0]},
+            {'sem_column': 'sem', 'sem_precomputed': True},
+            _check_sem_band,
+        ),
+        (
+            {'x': [1, 2, 3] * 2, 'y': [10, 20, 30, 15, 25, 35],
+             'sem': [1.0, 2.0, 3.0, 1.5, 2.5, 3.5],
+             'condition': ['A'] * 3 + ['B'] * 3},
+            {'hue': 'condition', 'sem_column': 'sem', 'sem_precomputed': True},
+            _check_hue_legend,
+        ),
+        (
+            {'x': [1, 2, 3], 'y': [10, 20, 30], 'sem': [0.0, 0.0, 0.0]},
+            {'sem_column': 'sem', 'sem_precomputed': True},
+            _check_sem_band,
+        ),
+        (
+            {'x': [1, 2, 3], 'y': [10, 20, 30], 'sem': [1.0, np.nan, 3.0]},
+            {'sem_column': 'sem', 'sem_precomputed': True},
+            _assert_plot_built,
+        ),
+        (
+            {'x': [1, 1, 2, 2], 'y': [10, 20, 30, 40],
+             'subject': ['s1', 's2', 's1', 's2']},
+            {'sem_column': 'subject'},
+            _check_computed_default,
+        ),
+    ],
+    ids=["single", "with_hue", "zero", "nan", "default_computed"],
+)
+def test_precomputed_sem_cases(tile, make_df, data, kwargs, check):
+    """Pre-computed SEM plotting across input shapes and modes."""
+    tile.set_plot(make_df(**data), x='x', y='y', **kwargs)
+    check(tile)
+
+
+
+def test_precomputed_sem_duplicate_x_values(tile, make_df):
     """Test pre-computed SEM with duplicate x-values (should average)."""
     data = {
         'x': [1, 1, 2, 2, 3, 3],
         'y': [10, 12, 20, 22, 30, 32],
         'sem': [1.0, 1.5, 2.0, 2.5, 3.0, 3.5]
     }
-    df = pd.DataFrame(data)
-    
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
+    df = make_df(**data)
     
     # This should trigger averaging and a warning
     tile.set_plot(df, x='x', y='y', sem_column='sem', sem_precomputed=True)
@@ -57,7 +94,7 @@ def test_precomputed_sem_duplicate_x_values():
     
     # Get the plotted data
     ax = tile.figure.axes[0]
-    lines = ax.get_lines()
+    lines = ax.lines
     assert len(lines) >= 1
     
     # Verify data was aggregated (should have 3 x-values)
@@ -65,35 +102,8 @@ def test_precomputed_sem_duplicate_x_values():
     assert len(x_data) == 3
 
 
-def test_precomputed_sem_with_hue():
-    """Test pre-computed SEM with hue grouping."""
-    data = {
-        'x': [1, 2, 3] * 2,
-        'y': [10, 20, 30, 15, 25, 35],
-        'sem': [1.0, 2.0, 3.0, 1.5, 2.5, 3.5],
-        'condition': ['A'] * 3 + ['B'] * 3
-    }
-    df = pd.DataFrame(data)
-    
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
-    tile.set_plot(df, x='x', y='y', hue='condition', sem_column='sem', sem_precomputed=True)
-    
-    # Verify plot was created with hue
-    ax = tile.figure.axes[0]
-    lines = ax.get_lines()
-    assert len(lines) == 2  # Two lines (one per hue value)
-    
-    # Should have legend
-    legend = ax.get_legend()
-    assert legend is not None
-    
-    # Should have filled regions for both hue categories
-    collections = ax.collections
-    assert len(collections) >= 2
-
 
-def test_precomputed_sem_vs_computed_sem():
+def test_precomputed_sem_vs_computed_sem(tile_factory, make_df):
     """Test that pre-computed and computed modes are different."""
     # Create data where computed SEM would differ from pre-computed
     data = {
@@ -102,16 +112,15 @@ def test_precomputed_sem_vs_computed_sem():
         'subject': ['s1', 's2', 's1', 's2'],
         'sem_precomp': [2.0, 2.0, 3.0, 3.0]
     }
-    df = pd.DataFrame(data)
+    df = make_df(**data)
     
-    app = QApplication.instance() or QApplication([])
     
     # Computed SEM mode
-    tile_computed = PlotTile()
+    tile_computed = tile_factory()
     tile_computed.set_plot(df, x='x', y='y', sem_column='subject', sem_precomputed=False)
     
     # Pre-computed SEM mode
-    tile_precomp = PlotTile()
+    tile_precomp = tile_factory()
     tile_precomp.set_plot(df, x='x', y='y', sem_column='sem_precomp', sem_precomputed=True)
     
     # Both should create plots
@@ -123,17 +132,15 @@ def test_precomputed_sem_vs_computed_sem():
     assert tile_precomp._sem_precomputed == True
 
 
-def test_precomputed_sem_clear_plot():
+def test_precomputed_sem_clear_plot(tile, make_df):
     """Test that clearing a plot resets pre-computed flag."""
     data = {
         'x': [1, 2, 3],
         'y': [10, 20, 30],
         'sem': [1.0, 2.0, 3.0]
     }
-    df = pd.DataFrame(data)
+    df = make_df(**data)
     
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
     tile.set_plot(df, x='x', y='y', sem_column='sem', sem_precomputed=True)
     
     assert tile._sem_precomputed == True
@@ -145,7 +152,7 @@ def test_precomputed_sem_clear_plot():
     assert tile._sem_precomputed == False
 
 
-def test_precomputed_sem_shared_limits():
+def test_precomputed_sem_shared_limits(make_df):
     """Test shared limits calculation with pre-computed SEM."""
     data = {
         'x': [1, 2, 3] * 2,
@@ -153,7 +160,7 @@ def test_precomputed_sem_shared_limits():
         'sem': [2.0, 3.0, 4.0, 2.5, 3.5, 4.5],
         'group': ['A'] * 3 + ['B'] * 3
     }
-    df = pd.DataFrame(data)
+    df = make_df(**data)
     
     filter_queries = [{'group': 'A'}, {'group': 'B'}]
     
@@ -174,74 +181,13 @@ def test_precomputed_sem_shared_limits():
     assert ylim[1] >= 39.0
 
 
-def test_precomputed_sem_with_nan_values():
-    """Test pre-computed SEM with NaN SEM values."""
-    data = {
-        'x': [1, 2, 3],
-        'y': [10, 20, 30],
-        'sem': [1.0, np.nan, 3.0]
-    }
-    df = pd.DataFrame(data)
-    
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
-    
-    # Should handle NaN SEM gracefully
-    tile.set_plot(df, x='x', y='y', sem_column='sem', sem_precomputed=True)
-    
-    # Verify plot was created
-    assert len(tile.figure.axes) > 0
-
 
-def test_precomputed_sem_zero_values():
-    """Test pre-computed SEM with zero SEM values."""
-    data = {
-        'x': [1, 2, 3],
-        'y': [10, 20, 30],
-        'sem': [0.0, 0.0, 0.0]
-    }
-    df = pd.DataFrame(data)
-    
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
-    tile.set_plot(df, x='x', y='y', sem_column='sem', sem_precomputed=True)
-    
-    # Verify plot was created
-    assert len(tile.figure.axes) > 0
-    
-    # Should still create filled region (even if zero)
-    ax = tile.figure.axes[0]
-    collections = ax.collections
-    assert len(collections) > 0
-
-
-def test_backward_compatibility_default_computed():
-    """Test that default behavior is computed SEM (not pre-computed)."""
-    data = {
-        'x': [1, 1, 2, 2],
-        'y': [10, 20, 30, 40],
-        'subject': ['s1', 's2', 's1', 's2']
-    }
-    df = pd.DataFrame(data)
-    
-    app = QApplication.instance() or QApplication([])
-    tile = PlotTile()
-    
-    # Don't specify sem_precomputed (should default to False)
-    tile.set_plot(df, x='x', y='y', sem_column='subject')
-    
-    # Should use computed mode
-    assert tile._sem_precomputed == False
-    
-    # Verify plot was created
-    assert len(tile.figure.axes) > 0
 
 
 def test_precomputed_sem_checkbox_state():
     """Test that checkbox state is properly captured in dialog."""
     from plot_organizer.ui.dialogs import QuickPlotDialog
     
-    app = QApplication.instance() or QApplication([])
     dialog = QuickPlotDialog(
         ds_to_columns={'test': ['x', 'y', 'sem']},
         ds_names={'test': 'Test Data'}
@@ -263,7 +209,6 @@ def test_precomputed_sem_info_label_updates():
     """Test that info label updates when checkbox state changes."""
     from plot_organizer.ui.dialogs import QuickPlotDialog
     
-    app = QApplication.instance() or QApplication([])
     dialog = QuickPlotDialog(
         ds_to_columns={'test': ['x', 'y', 'sem']},
         ds_names={'test': 'Test Data'}
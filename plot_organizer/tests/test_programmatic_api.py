@@ -20,6 +20,44 @@ from plot_organizer.api import (
 )
 
 
+@pytest.fixture(scope="module")
+def species_treatment_csv(tmp_path_factory):
+    """CSV with two group columns (2 species x 2 treatments), written once."""
+    path = tmp_path_factory.mktemp("grouped") / "species_treatment.csv"
+    pd.DataFrame({
+        "time": [1, 2, 3, 1, 2, 3, 1, 2, 3, 1, 2, 3],
+        "value": [10, 20, 30, 15, 25, 35, 12, 22, 32, 18, 28, 38],
+        "species": ["A", "A", "A", "A", "A", "A", "B", "B", "B", "B", "B", "B"],
+        "treatment": ["X", "X", "X", "Y", "Y", "Y", "X", "X", "X", "Y", "Y", "Y"],
+    }).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="module")
+def two_group_csv(tmp_path_factory):
+    """CSV with a single A/B group column, written once."""
+    path = tmp_path_factory.mktemp("grouped") / "two_group.csv"
+    pd.DataFrame({
+        "x": [1, 2, 3] * 2,
+        "y": [10, 20, 30] * 2,
+        "group": ["A"] * 3 + ["B"] * 3,
+    }).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="module")
+def model_dataset_csv(tmp_path_factory):
+    """CSV with model/dataset group columns, written once."""
+    path = tmp_path_factory.mktemp("grouped") / "model_dataset.csv"
+    pd.DataFrame({
+        "time": [1, 2, 3] * 4,
+        "accuracy": [0.8, 0.85, 0.9] * 4,
+        "model": ["A"] * 6 + ["B"] * 6,
+        "dataset": ["X", "X", "X", "Y", "Y", "Y"] * 2,
+    }).to_csv(path, index=False)
+    return path
+
+
 def test_create_datasource():
     """Test datasource creation."""
     ds = create_datasource("test_data", "data/test.csv")
@@ -271,22 +309,11 @@ def test_json_serialization(tmp_path):
     assert loaded == project
 
 
-def test_create_grouped_plots(tmp_path):
+def test_create_grouped_plots(species_treatment_csv):
     """Test creating grouped plots with auto-computed shared limits."""
-    # Create test CSV
-    csv_path = tmp_path / "test_groups.csv"
-    df = pd.DataFrame({
-        "time": [1, 2, 3, 1, 2, 3, 1, 2, 3, 1, 2, 3],
-        "value": [10, 20, 30, 15, 25, 35, 12, 22, 32, 18, 28, 38],
-        "species": ["A", "A", "A", "A", "A", "A", "B", "B", "B", "B", "B", "B"],
-        "treatment": ["X", "X", "X", "Y", "Y", "Y", "X", "X", "X", "Y", "Y", "Y"],
-    })
-    df.to_csv(csv_path, index=False)
-    
-    # Create grouped plots
     plots = create_grouped_plots(
         datasource_id="ds123",
-        dataframe_path=str(csv_path),
+        dataframe_path=str(species_treatment_csv),
         x="time",
         y="value",
         groups=["species", "treatment"],
@@ -322,19 +349,11 @@ def test_create_grouped_plots(tmp_path):
     assert "treatment=X" in plots[0]["title"]
 
 
-def test_create_grouped_plots_column_layout(tmp_path):
+def test_create_grouped_plots_column_layout(two_group_csv):
     """Test grouped plots with column layout."""
-    csv_path = tmp_path / "test_col_layout.csv"
-    df = pd.DataFrame({
-        "x": [1, 2, 3] * 2,
-        "y": [10, 20, 30] * 2,
-        "group": ["A"] * 3 + ["B"] * 3,
-    })
-    df.to_csv(csv_path, index=False)
-    
     plots = create_grouped_plots(
         datasource_id="ds",
-        dataframe_path=str(csv_path),
+        dataframe_path=str(two_group_csv),
         x="x",
         y="y",
         groups=["group"],
@@ -351,20 +370,12 @@ def test_create_grouped_plots_column_layout(tmp_path):
     assert plots[1]["grid_position"]["col"] == 2
 
 
-def test_create_grouped_plots_with_manual_ylim(tmp_path):
+def test_create_grouped_plots_with_manual_ylim(two_group_csv):
     """Test that manual ylim overrides auto-computation."""
-    csv_path = tmp_path / "test_manual_ylim.csv"
-    df = pd.DataFrame({
-        "x": [1, 2] * 2,
-        "y": [10, 20] * 2,
-        "group": ["A", "A", "B", "B"],
-    })
-    df.to_csv(csv_path, index=False)
-    
     manual_ylim = (0, 100)
     plots = create_grouped_plots(
         datasource_id="ds",
-        dataframe_path=str(csv_path),
+        dataframe_path=str(two_group_csv),
         x="x",
         y="y",
         groups=["group"],
@@ -375,20 +386,11 @@ def test_create_grouped_plots_with_manual_ylim(tmp_path):
     assert all(p["ylim"] == list(manual_ylim) for p in plots)
 
 
-def test_quick_grouped_project(tmp_path):
+def test_quick_grouped_project(model_dataset_csv):
     """Test quick_grouped_project convenience function."""
-    csv_path = tmp_path / "test_quick_grouped.csv"
-    df = pd.DataFrame({
-        "time": [1, 2, 3] * 4,
-        "accuracy": [0.8, 0.85, 0.9] * 4,
-        "model": ["A"] * 6 + ["B"] * 6,
-        "dataset": ["X", "X", "X", "Y", "Y", "Y"] * 2,
-    })
-    df.to_csv(csv_path, index=False)
-    
     project = quick_grouped_project(
         datasource_name="ML Results",
-        datasource_path=str(csv_path),
+        datasource_path=str(model_dataset_csv),
         x="time",
         y="accuracy",
         groups=["model", "dataset"],
@@ -238,6 +238,53 @@ def test_spanning_plots(tmp_path):
     assert plot["grid_position"]["colspan"] == 3
 
 
+def test_binary_roundtrip_partial_error_markers(tmp_path):
+    """Test that binary workspaces preserve key absence in error markers.
+
+    The Feather marker table materializes every column, so fields a marker
+    never had must be dropped again on load; present-but-None keys would
+    defeat the renderer's .get() defaults (e.g. marker shape, color).
+    """
+    markers = [
+        {"x": 5.0, "xerr": 0.5, "color": "red"},  # no y/yerr/marker/label
+        {"x": 10.0, "y": 1, "xerr": 0.3, "marker": "^", "color": "blue", "label": "Event"},
+    ]
+    grid_layout = [
+        {
+            "grid_position": {"row": 0, "col": 0, "rowspan": 1, "colspan": 1},
+            "datasource_id": "ds1",
+            "x": "x",
+            "y": "y",
+            "hue": None,
+            "sem_column": None,
+            "sem_precomputed": False,
+            "filter_query": None,
+            "hlines": [],
+            "vlines": [],
+            "style_line": True,
+            "style_marker": False,
+            "ylim": None,
+            "title": None,
+            "error_markers": markers,
+        }
+    ]
+
+    datasources = {
+        "ds1": {
+            "name": "data",
+            "path": str(tmp_path / "data.csv"),
+            "schema": [],
+        }
+    }
+
+    project_path = tmp_path / "markers.ppo"
+    save_workspace(str(project_path), grid_layout, datasources, grid_rows=2, grid_cols=2, binary=True)
+
+    loaded = load_workspace(str(project_path))
+
+    assert loaded["plots"][0]["error_markers"] == markers
+
+
 def test_datasource_matching():
     """Test that datasource matching by dataframe works correctly.
     
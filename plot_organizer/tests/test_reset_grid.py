@@ -12,6 +12,8 @@ if not QApplication.instance():
 
 from plot_organizer.ui.grid_board import GridBoard
 
+pytestmark = pytest.mark.gui
+
 
 def test_reset_to_size_basic():
     """Test resetting grid to a specific size."""
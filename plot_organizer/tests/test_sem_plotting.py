@@ -1,10 +1,13 @@
 """Tests for SEM (Standard Error of the Mean) plotting functionality."""
 
+import pytest
 import pandas as pd
 import numpy as np
 from PySide6.QtWidgets import QApplication
 from plot_organizer.ui.grid_board import PlotTile
 
+pytestmark = pytest.mark.gui
+
 
 def test_sem_column_grouping_and_aggregation():
     """Test that SEM column correctly groups data before computing mean and SEM."""
@@ -28,7 +31,7 @@ def test_sem_column_grouping_and_aggregation():
     
     # Get the plotted line data
     ax = tile.figure.axes[0]
-    lines = ax.get_lines()
+    lines = ax.lines
     assert len(lines) == 1  # One mean line
     
     # Verify fill_between was called for SEM shading
@@ -52,11 +55,11 @@ def test_sem_with_hue():
     
     # Verify plot was created with hue
     ax = tile.figure.axes[0]
-    lines = ax.get_lines()
+    lines = ax.lines
     assert len(lines) == 2  # Two lines (one per hue value)
     
     # Should have legend
-    legend = ax.get_legend()
+    legend = ax.legend_
     assert legend is not None
 
 
@@ -77,7 +80,7 @@ def test_no_sem_column():
     assert tile._sem_column is None
     
     ax = tile.figure.axes[0]
-    lines = ax.get_lines()
+    lines = ax.lines
     assert len(lines) == 1
     
     # Should NOT have filled regions
@@ -106,7 +109,7 @@ def test_sem_computation_correctness():
     tile.set_plot(df, x='x', y='y', sem_column='subject')
     
     ax = tile.figure.axes[0]
-    lines = ax.get_lines()
+    lines = ax.lines
     
     # Get the plotted y value
     y_data = lines[0].get_ydata()
@@ -132,7 +135,7 @@ def test_sem_with_varying_values():
     tile.set_plot(df, x='x', y='y', sem_column='subject')
     
     ax = tile.figure.axes[0]
-    lines = ax.get_lines()
+    lines = ax.lines
     y_data = lines[0].get_ydata()
     
     # Mean should be 13
@@ -7,6 +7,8 @@ from PySide6.QtWidgets import QApplication
 from plot_organizer.ui.grid_board import GridBoard, PlotTile
 from plot_organizer.ui.dialogs import QuickPlotDialog
 
+pytestmark = pytest.mark.gui
+
 
 @pytest.fixture(scope="module")
 def qapp():
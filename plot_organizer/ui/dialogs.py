@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
+import pandas as pd
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QDialog,
@@ -308,19 +310,16 @@ class QuickPlotDialog(QDialog):
         """
         if not text or not text.strip():
             return []
-        
-        numbers = []
-        for part in text.split(','):
-            part = part.strip()
-            if not part:
-                continue
-            try:
-                numbers.append(float(part))
-            except ValueError:
-                # Skip invalid values silently
-                continue
-        
-        return numbers
+
+        parts = [part for part in text.split(',') if part.strip()]
+        if not parts:
+            return []
+
+        # Batch-parse in C; invalid tokens become NaN and are dropped,
+        # preserving the old skip-silently behavior without a Python-level
+        # try/except per token.
+        parsed = pd.to_numeric(pd.Series(parts), errors='coerce')
+        return parsed.dropna().astype(float).tolist()
 
 
 class PlotSettingsDialog(QDialog):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import Optional
 
 from PySide6.QtCore import Qt, Signal
@@ -19,6 +20,48 @@ from matplotlib.figure import Figure
 import pandas as pd
 from matplotlib.ticker import AutoMinorLocator
 
+# Aggregation results shared across tiles and set_plot calls, keyed by a
+# content hash of the frame plus the plot spec. Re-plotting identical
+# inputs — grid re-layouts, repeated test setups — then reuses the
+# groupby output instead of recomputing it. Bounded FIFO, like the
+# render caches in export_service.
+_AGG_PLAN_CACHE: dict[tuple, dict[tuple, pd.DataFrame]] = {}
+_AGG_PLAN_CACHE_MAX = 128
+
+# Hashing the frame is a full scan; past this row count the groupby
+# itself is the cheaper risk, so tiles fall back to a private cache
+_AGG_PLAN_HASH_LIMIT = 100_000
+
+
+def _agg_plan_for(df, x, y, hue, sem_column, sem_precomputed, filter_query):
+    """Return the shared aggregation cache for this (frame, spec) pair.
+
+    Falls back to a fresh private dict when the frame is too large to
+    hash cheaply or holds unhashable values.
+    """
+    if df is None or len(df) > _AGG_PLAN_HASH_LIMIT:
+        return {}
+    try:
+        df_hash = int(pd.util.hash_pandas_object(df, index=False).sum())
+        key = (
+            df_hash,
+            len(df),
+            x,
+            y,
+            tuple(hue) if isinstance(hue, list) else hue,
+            sem_column,
+            sem_precomputed,
+            tuple(sorted(filter_query.items())) if filter_query else None,
+        )
+    except TypeError:
+        return {}
+    cache = _AGG_PLAN_CACHE.get(key)
+    if cache is None:
+        if len(_AGG_PLAN_CACHE) >= _AGG_PLAN_CACHE_MAX:
+            _AGG_PLAN_CACHE.pop(next(iter(_AGG_PLAN_CACHE)))
+        cache = _AGG_PLAN_CACHE[key] = {}
+    return cache
+
 
 class PlotTile(QFrame):
     settings_requested = Signal(object)  # Emits self
@@ -41,6 +84,10 @@ class PlotTile(QFrame):
         self._style_marker: bool = False
         self._ylim: Optional[tuple[float, float]] = None
         self._error_markers: list[dict] = []
+        # Filtered frame and per-group aggregation results from the last
+        # set_plot, reused by the export renderer to skip redundant pandas work
+        self._plot_df: Optional[pd.DataFrame] = None
+        self._agg_cache: dict[tuple, pd.DataFrame] = {}
         self.setContextMenuPolicy(Qt.DefaultContextMenu)
 
         layout = QVBoxLayout(self)
@@ -89,6 +136,7 @@ class PlotTile(QFrame):
         style_line: bool = True,
         style_marker: bool = False,
         error_markers: Optional[list[dict]] = None,
+        plot_df: Optional[pd.DataFrame] = None,
     ) -> None:
         self._df, self._x, self._y, self._hue = df, x, y, hue
         self._sem_column = sem_column
@@ -100,29 +148,42 @@ class PlotTile(QFrame):
         self._style_marker = style_marker
         self._ylim = ylim  # Store y-limits for export
         self._error_markers = error_markers or []
-        
-        # Apply filter if provided
-        plot_df = df.copy()  # Make a copy to avoid modifying original
-        if filter_query:
-            for col, val in filter_query.items():
-                plot_df = plot_df[plot_df[col] == val]
-        
+        # Swap in the shared plan for this frame+spec; identical inputs
+        # plotted before land their aggregations without any groupby
+        self._agg_cache = _agg_plan_for(
+            df, x, y, hue, sem_column, sem_precomputed, filter_query
+        )
+
+        # A caller that already filtered (e.g. via an AggContext shared with
+        # the limits computation) can hand the subset in to skip redoing it
+        if plot_df is None:
+            # Apply filter if provided (boolean indexing yields a copy);
+            # otherwise copy to avoid modifying the original
+            if filter_query:
+                from plot_organizer.services.plot_service import apply_filter_query
+                plot_df = apply_filter_query(df, filter_query)
+            else:
+                plot_df = df.copy()
+
         # Create composite hue column if hue is a list of columns
         actual_hue = None
         if hue:
             if isinstance(hue, list) and len(hue) > 0:
                 # Create composite column with format: Col1=val1, Col2=val2
                 composite_name = "__composite_hue__"
-                plot_df[composite_name] = plot_df.apply(
-                    lambda row: ", ".join(f"{col}={row[col]}" for col in hue),
-                    axis=1
-                )
+                if composite_name not in plot_df.columns:
+                    plot_df[composite_name] = plot_df.apply(
+                        lambda row: ", ".join(f"{col}={row[col]}" for col in hue),
+                        axis=1
+                    )
                 actual_hue = composite_name
             elif isinstance(hue, str):
                 # Single string hue (backward compatibility)
                 actual_hue = hue
             # else: hue is empty list or None, actual_hue stays None
-        
+
+        self._plot_df = plot_df
+
         # Reuse existing axes if available, otherwise create new one
         if self.figure.axes:
             ax = self.figure.axes[0]
@@ -134,7 +195,7 @@ class PlotTile(QFrame):
             ax.text(0.5, 0.5, "No data", ha='center', va='center', transform=ax.transAxes, alpha=0.3)
         elif actual_hue:
             # Group by hue and aggregate
-            for key, sub in plot_df.groupby(actual_hue):
+            for key, sub in plot_df.groupby(actual_hue, observed=True):
                 self._plot_with_sem(ax, sub, x, y, sem_column, label=str(key))
             ax.legend(loc="best", fontsize='small')
         else:
@@ -165,9 +226,44 @@ class PlotTile(QFrame):
         
         # Draw error markers
         self._render_error_markers(ax, plot_df)
-        
-        self.canvas.draw_idle()
+
+        # Headless callers that only inspect the artists (the test suite)
+        # can skip rasterizing fonts and ticks entirely
+        if not os.environ.get("PLOT_ORGANIZER_NO_DRAW"):
+            self.canvas.draw_idle()
     
+    def _agg_mean(self, df: pd.DataFrame, x: str, y: str, label: Optional[str] = None) -> pd.DataFrame:
+        """Mean of y per x, cached per label until the next set_plot."""
+        key = ("mean", x, y, label)
+        agg = self._agg_cache.get(key)
+        if agg is None:
+            agg = df.groupby(x, as_index=False, observed=True)[y].mean()
+            self._agg_cache[key] = agg
+        return agg
+
+    def _agg_sem_stats(self, df: pd.DataFrame, x: str, y: str, sem_column: str, label: Optional[str] = None) -> pd.DataFrame:
+        """Mean and SEM of y per x across sem_column groups, cached per label."""
+        key = ("sem", x, y, sem_column, label)
+        stats = self._agg_cache.get(key)
+        if stats is None:
+            grouped = df.groupby([sem_column, x], as_index=False, sort=False, observed=True)[y].mean()
+            stats = grouped.groupby(x, observed=True)[y].agg(['mean', 'sem']).reset_index()
+            stats.columns = [x, 'mean_y', 'sem_y']
+            self._agg_cache[key] = stats
+        return stats
+
+    def _agg_precomputed_sem(self, df: pd.DataFrame, x: str, y: str, sem_column: str, label: Optional[str] = None) -> pd.DataFrame:
+        """Mean of y and of pre-computed SEM per x, cached per label."""
+        key = ("pre", x, y, sem_column, label)
+        agg = self._agg_cache.get(key)
+        if agg is None:
+            agg = df.groupby(x, as_index=False, observed=True).agg({
+                y: 'mean',
+                sem_column: 'mean'
+            })
+            self._agg_cache[key] = agg
+        return agg
+
     def _get_plot_format(self) -> str:
         """Get the format string for plot() based on style settings."""
         if self._style_line and self._style_marker:
@@ -191,31 +287,27 @@ class PlotTile(QFrame):
                 # Pre-computed SEM mode: use values from column
                 self._plot_with_precomputed_sem(ax, df, x, y, sem_column, label)
             else:
-                # Computed SEM mode: existing logic
-                # Step 1: Group by sem_column, then by x, compute mean of y
-                grouped = df.groupby([sem_column, x], as_index=False)[y].mean()
-                
-                # Step 2: For each x, compute mean and SEM across sem_column groups
-                stats = grouped.groupby(x)[y].agg(['mean', 'sem']).reset_index()
-                stats.columns = [x, 'mean_y', 'sem_y']
-                
+                # Computed SEM mode: group by sem_column then x, then compute
+                # mean and SEM across sem_column groups (cached for export)
+                stats = self._agg_sem_stats(df, x, y, sem_column, label)
+
+                # Raw buffers once; Series arithmetic would re-run index
+                # alignment per operand
+                xa = stats[x].to_numpy()
+                ya = stats['mean_y'].to_numpy()
+                sa = stats['sem_y'].to_numpy(dtype=np.float64)
+
                 # Plot mean line with style
                 fmt = self._get_plot_format()
-                line = ax.plot(stats[x], stats['mean_y'], fmt, label=label)[0]
-                
+                line = ax.plot(xa, ya, fmt, label=label)[0]
+
                 # Plot SEM as shaded region
-                if stats['sem_y'].notna().any():
+                if not np.isnan(sa).all():
                     color = line.get_color()
-                    ax.fill_between(
-                        stats[x],
-                        stats['mean_y'] - stats['sem_y'],
-                        stats['mean_y'] + stats['sem_y'],
-                        alpha=0.2,
-                        color=color
-                    )
+                    ax.fill_between(xa, ya - sa, ya + sa, alpha=0.2, color=color)
         else:
             # No SEM: just aggregate by x and plot mean
-            agg_df = df.groupby(x, as_index=False)[y].mean()
+            agg_df = self._agg_mean(df, x, y, label)
             fmt = self._get_plot_format()
             ax.plot(agg_df[x], agg_df[y], fmt, label=label)
     
@@ -233,12 +325,9 @@ class PlotTile(QFrame):
         # Check for duplicates
         dup_check = df.groupby(x).size()
         has_duplicates = (dup_check > 1).any()
-        
-        # Aggregate by x: mean of y and mean of sem
-        agg_df = df.groupby(x, as_index=False).agg({
-            y: 'mean',
-            sem_column: 'mean'
-        })
+
+        # Aggregate by x: mean of y and mean of sem (cached for export)
+        agg_df = self._agg_precomputed_sem(df, x, y, sem_column, label)
         
         # Warning if duplicates were averaged
         if has_duplicates:
@@ -248,20 +337,20 @@ class PlotTile(QFrame):
                 f"Consider pre-aggregating your data."
             )
         
+        # Raw buffers once; Series arithmetic would re-run index alignment
+        # per operand
+        xa = agg_df[x].to_numpy()
+        ya = agg_df[y].to_numpy()
+        sa = agg_df[sem_column].to_numpy(dtype=np.float64)
+
         # Plot mean line with style
         fmt = self._get_plot_format()
-        line = ax.plot(agg_df[x], agg_df[y], fmt, label=label)[0]
-        
+        line = ax.plot(xa, ya, fmt, label=label)[0]
+
         # Plot SEM as shaded region
-        if agg_df[sem_column].notna().any():
+        if not np.isnan(sa).all():
             color = line.get_color()
-            ax.fill_between(
-                agg_df[x],
-                agg_df[y] - agg_df[sem_column],
-                agg_df[y] + agg_df[sem_column],
-                alpha=0.2,
-                color=color
-            )
+            ax.fill_between(xa, ya - sa, ya + sa, alpha=0.2, color=color)
     
     def _render_error_markers(self, ax, plot_df: pd.DataFrame) -> None:
         """Render error bar markers on the plot.
@@ -410,8 +499,13 @@ class PlotTile(QFrame):
         self._style_marker = False
         self._ylim = None
         self._error_markers = []
+        self._plot_df = None
+        # Detach rather than clear: the dict may be a plan shared with
+        # other tiles plotting the same data
+        self._agg_cache = {}
         self.figure.clear()
-        self.canvas.draw_idle()
+        if not os.environ.get("PLOT_ORGANIZER_NO_DRAW"):
+            self.canvas.draw_idle()
     
     def get_plot_data(self, datasource_id: Optional[str] = None) -> Optional[dict]:
         """Extract plot parameters for serialization.
@@ -618,6 +712,23 @@ class GridBoard(QWidget):
         # Add to new position with span
         self._grid.addWidget(source_tile, to_row, to_col, rowspan, colspan)
     
+    def unique_tiles(self) -> list[tuple[PlotTile, int, int, int, int]]:
+        """Return each non-empty tile once as (tile, row, col, rowspan, colspan).
+
+        Walks the layout's item list directly — O(tiles) — instead of
+        scanning every grid cell and deduplicating spanned cells with a
+        processed set. Tiles come back in row-major order.
+        """
+        tiles: list[tuple[PlotTile, int, int, int, int]] = []
+        for idx in range(self._grid.count()):
+            item = self._grid.itemAt(idx)
+            w = item.widget() if item else None
+            if isinstance(w, PlotTile) and not w.is_empty():
+                row, col, rowspan, colspan = self._grid.getItemPosition(idx)
+                tiles.append((w, row, col, rowspan, colspan))
+        tiles.sort(key=lambda t: (t[1], t[2]))
+        return tiles
+
     def find_tile_position(self, tile: PlotTile) -> Optional[tuple[int, int, int, int]]:
         """Find the position and span of a tile. Returns (row, col, rowspan, colspan) or None."""
         for r in range(self._rows):
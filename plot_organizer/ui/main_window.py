@@ -160,9 +160,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Too Many Combinations", str(e))
             return
         
+        # One context shared between the limits pass and the tile renders,
+        # so each filter query's subset is materialized only once
+        from plot_organizer.services.plot_service import AggContext
+        ctx = AggContext(df, hue)
+
         # Compute shared axes if groups present
         xlim, ylim = None, None
-        
+
         # Check if custom y-limits are provided
         if y_min is not None and y_max is not None:
             # Use custom y-limits for all plots
@@ -172,15 +177,12 @@ class MainWindow(QMainWindow):
             if sem_column:
                 # Use SEM-aware limits calculation
                 from plot_organizer.services.plot_service import shared_limits_with_sem
-                xlim, ylim = shared_limits_with_sem(df, filter_queries, x, y, sem_column, hue, sem_precomputed)
+                xlim, ylim = shared_limits_with_sem(
+                    df, filter_queries, x, y, sem_column, hue, sem_precomputed, ctx=ctx
+                )
             else:
                 # Use original limits calculation
-                subsets = []
-                for fq in filter_queries:
-                    subset = df
-                    for col, val in fq.items():
-                        subset = subset[subset[col] == val]
-                    subsets.append(subset)
+                subsets = [ctx.subset(fq) for fq in filter_queries]
                 xlim, ylim = shared_limits(subsets, x, y)
         
         # Place plots in grid
@@ -214,6 +216,7 @@ class MainWindow(QMainWindow):
                 vlines=vlines,
                 style_line=style_line,
                 style_marker=style_marker,
+                plot_df=ctx.subset(fq),
             )
             # Connect signals for new tiles
             tile.settings_requested.connect(self._on_tile_settings, Qt.UniqueConnection)